@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+import argparse
+import glob
+import json
+import os
+import time
+import tracemalloc
+
+from kivy_text_metrics import FontCache, TextMetrics, font_cache
+from playback_telemetry import percentile
+
+# Headless benchmark for kivy_text_metrics.TextMetrics.
+#
+# Shapes a reference corpus with every font in Fonts/ at each size offered by the font size spinner and reports, per
+# font and size:
+#
+#     words/s     get_text_extents calls per second over the whole corpus
+#     p50/p99     latency of a single get_text_extents call, in microseconds
+#     batch w/s   words per second through get_text_extents_many on the same corpus
+#     peak KiB    peak Python heap allocated while shaping the corpus (tracemalloc)
+#     shape hit   hit rate of the shaping cache
+#     loads       glyphs actually loaded from freetype / glyph table lookups
+#
+# Nothing here imports Kivy or opens a Window, so it runs anywhere freetype-py and uharfbuzz are installed.
+#
+# Every font and size gets a fresh FontCache without the on-disk metrics store, so runs measure the in-process caches
+# only and do not depend on what an earlier run left behind. Use --disk-cache to include the store.
+#
+# Example calls
+#
+#     # All fonts, all sizes, built in corpus
+#     python benchmark_text_metrics.py
+#
+#     # A real book, two fonts, saving the results and comparing them against an earlier run
+#     python benchmark_text_metrics.py --corpus book.txt --fonts Fonts/tahoma.ttf Fonts/FreeSerif.otf \
+#         --json after.json --compare before.json
+
+# Sizes offered by the font size spinner in main.py
+spinner_sizes = [24, 28, 32, 36, 40, 44, 48]
+
+# Used when no --corpus is given (Lincoln's Gettysburg Address, public domain)
+reference_corpus = """
+Four score and seven years ago our fathers brought forth on this continent, a new nation, conceived in Liberty, and
+dedicated to the proposition that all men are created equal. Now we are engaged in a great civil war, testing whether
+that nation, or any nation so conceived and so dedicated, can long endure. We are met on a great battle-field of that
+war. We have come to dedicate a portion of that field, as a final resting place for those who here gave their lives
+that that nation might live. It is altogether fitting and proper that we should do this. But, in a larger sense, we
+can not dedicate -- we can not consecrate -- we can not hallow -- this ground. The brave men, living and dead, who
+struggled here, have consecrated it, far above our poor power to add or detract. The world will little note, nor long
+remember what we say here, but it can never forget what they did here. It is for us the living, rather, to be
+dedicated here to the unfinished work which they who fought here have thus far so nobly advanced. It is rather for us
+to be here dedicated to the great task remaining before us -- that from these honored dead we take increased devotion
+to that cause for which they gave the last full measure of devotion -- that we here highly resolve that these dead
+shall not have died in vain -- that this nation, under God, shall have a new birth of freedom -- and that government
+of the people, by the people, for the people, shall not perish from the earth.
+"""
+
+# get_text_extents needs the size of the texture Kivy would have rendered; any width works for timing purposes
+texture_size = (100, 50)
+
+
+def new_cache(use_disk_cache):
+    return FontCache(store=font_cache.store if use_disk_cache else None)
+
+
+def bench_font(font_path, font_size, words, use_disk_cache):
+    # Per call latency and overall throughput
+    metrics = TextMetrics(font_path, font_size, cache=new_cache(use_disk_cache))
+    latencies = []
+    clock = time.perf_counter
+    start = clock()
+    for word in words:
+        t0 = clock()
+        metrics.get_text_extents(word, texture_size)
+        latencies.append(clock() - t0)
+    elapsed = clock() - start
+    latencies.sort()
+    shape_stats = metrics.cache.shapes.stats()
+    glyph_stats = metrics.font.glyphs.stats()
+
+    # Batch shaping of the whole corpus
+    batch_metrics = TextMetrics(font_path, font_size, cache=new_cache(use_disk_cache))
+    start = clock()
+    batch_metrics.get_text_extents_many(words)
+    batch_elapsed = clock() - start
+
+    # Peak memory, in a separate pass since tracemalloc slows everything down
+    tracemalloc.start()
+    memory_metrics = TextMetrics(font_path, font_size, cache=new_cache(use_disk_cache))
+    for word in words:
+        memory_metrics.get_text_extents(word, texture_size)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        'font': os.path.basename(font_path),
+        'size': font_size,
+        'words': len(words),
+        'words_per_sec': len(words) / elapsed if elapsed else 0.0,
+        'p50_us': percentile(latencies, 0.50) * 1e6,
+        'p99_us': percentile(latencies, 0.99) * 1e6,
+        'batch_words_per_sec': len(words) / batch_elapsed if batch_elapsed else 0.0,
+        'peak_kib': peak / 1024,
+        'shape_hit_rate': shape_stats['hit_rate'],
+        'glyph_loads': glyph_stats['glyph_loads'],
+        'glyph_lookups': glyph_stats['lookups'],
+    }
+
+
+def print_results(results, baseline=None):
+    baseline = {(r['font'], r['size']): r for r in baseline or []}
+    print(f"{'font':<40} {'size':>4} {'words/s':>10} {'p50 us':>8} {'p99 us':>8} {'batch w/s':>10} "
+          f"{'peak KiB':>9} {'shape hit':>9} {'loads':>13}")
+    for r in results:
+        line = (f"{r['font']:<40} {r['size']:>4} {r['words_per_sec']:>10.0f} {r['p50_us']:>8.1f} "
+                f"{r['p99_us']:>8.1f} {r['batch_words_per_sec']:>10.0f} {r['peak_kib']:>9.0f} "
+                f"{r['shape_hit_rate']:>9.1%} {r['glyph_loads']:>6}/{r['glyph_lookups']:<6}")
+        before = baseline.get((r['font'], r['size']))
+        if before and before['words_per_sec']:
+            line += f"  x{r['words_per_sec'] / before['words_per_sec']:.2f} words/s vs baseline"
+        print(line)
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description='Benchmark TextMetrics over the bundled fonts.')
+    parser.add_argument('--corpus', help='text file to shape (defaults to a built in passage)')
+    parser.add_argument('--repeat', type=int, default=20, help='times to repeat the built in corpus')
+    parser.add_argument('--fonts', nargs='+', help='font files (defaults to every font in Fonts/)')
+    parser.add_argument('--sizes', nargs='+', type=int, default=spinner_sizes)
+    parser.add_argument('--disk-cache', action='store_true', help='use the on-disk font metrics store')
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--compare', help='results file from an earlier run to compare against')
+    args = parser.parse_args()
+
+    if args.corpus:
+        with open(args.corpus, encoding='utf-8', errors='replace') as f:
+            words = f.read().split()
+    else:
+        words = reference_corpus.split() * args.repeat
+
+    font_paths = args.fonts or sorted(glob.glob(os.path.join(here, 'Fonts', '*.ttf')) +
+                                      glob.glob(os.path.join(here, 'Fonts', '*.otf')))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    results = []
+    for font_path in font_paths:
+        for font_size in args.sizes:
+            results.append(bench_font(font_path, font_size, words, args.disk_cache))
+    print_results(results, baseline)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
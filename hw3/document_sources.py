@@ -0,0 +1,113 @@
+import codecs
+import gzip
+import lzma
+import posixpath
+import zipfile
+from html.parser import HTMLParser
+from urllib.parse import unquote
+from xml.etree import ElementTree
+
+from document_loader import StreamWordIndex, WordIndex
+
+# Characters of decoded text handed to the word index at a time
+chunk_size = 1 << 18
+
+
+# Each source takes a path and yields the document's text, in reading order, as str chunks of about chunk_size.
+# Register new formats in document_sources, keyed by file name suffix.
+
+def gzip_chunks(path, encoding='utf-8'):
+    with gzip.open(path, 'rt', encoding=encoding, errors='replace') as f:
+        for chunk in iter(lambda: f.read(chunk_size), ''):
+            yield chunk
+
+
+def xz_chunks(path, encoding='utf-8'):
+    with lzma.open(path, 'rt', encoding=encoding, errors='replace') as f:
+        for chunk in iter(lambda: f.read(chunk_size), ''):
+            yield chunk
+
+
+# The visible text of an (X)HTML document, fed to it in pieces.
+# Block level tags become spaces so words in neighbouring paragraphs are not glued together.
+class HTMLText(HTMLParser):
+    block_tags = {'p', 'div', 'br', 'hr', 'li', 'tr', 'td', 'th', 'dt', 'dd', 'blockquote', 'section', 'h1', 'h2',
+                  'h3', 'h4', 'h5', 'h6', 'pre', 'table', 'ul', 'ol'}
+    skipped_tags = {'head', 'script', 'style'}
+
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+        self.skip_depth = 0
+
+    # The text found since the last call
+    def take(self):
+        text = ''.join(self.parts)
+        self.parts.clear()
+        return text
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.skipped_tags: self.skip_depth += 1
+        elif tag in self.block_tags: self.parts.append(' ')
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in self.block_tags: self.parts.append(' ')
+
+    def handle_endtag(self, tag):
+        if tag in self.skipped_tags: self.skip_depth = max(self.skip_depth - 1, 0)
+        elif tag in self.block_tags: self.parts.append(' ')
+
+    def handle_data(self, data):
+        if not self.skip_depth: self.parts.append(data)
+
+
+# Paths inside the archive of the EPUB's content documents, in reading (spine) order
+def epub_spine(book):
+    container = ElementTree.fromstring(book.read('META-INF/container.xml'))
+    opf_path = container.find('.//{*}rootfile').get('full-path')
+    opf = ElementTree.fromstring(book.read(opf_path))
+    opf_dir = posixpath.dirname(opf_path)
+
+    hrefs = {item.get('id'): item.get('href') for item in opf.iterfind('.//{*}manifest/{*}item')}
+    spine = []
+    for itemref in opf.iterfind('.//{*}spine/{*}itemref'):
+        href = hrefs.get(itemref.get('idref'))
+        if href is not None:
+            spine.append(posixpath.normpath(posixpath.join(opf_dir, unquote(href.split('#')[0]))))
+    return spine
+
+
+def epub_chunks(path):
+    with zipfile.ZipFile(path) as book:
+        for name in epub_spine(book):
+            parser = HTMLText()
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            with book.open(name) as f:
+                for data in iter(lambda: f.read(chunk_size), b''):
+                    parser.feed(decoder.decode(data))
+                    yield parser.take()
+            parser.feed(decoder.decode(b'', final=True))
+            parser.close()
+            # chapters never run into each other
+            yield parser.take() + ' '
+
+
+document_sources = {
+    '.txt.gz': gzip_chunks,
+    '.txt.xz': xz_chunks,
+    '.epub': epub_chunks,
+}
+
+
+# The words of the document at path: plain text is indexed straight from a memory map, anything with a registered
+# source is decoded and indexed as it streams
+def open_document(path):
+    lower = path.lower()
+    for suffix, source in document_sources.items():
+        if lower.endswith(suffix):
+            return StreamWordIndex(source(path))
+    return WordIndex(path)
+
+
+# Patterns for the file chooser
+document_filters = ['*.txt'] + [f'*{suffix}' for suffix in document_sources]
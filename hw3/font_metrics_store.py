@@ -0,0 +1,134 @@
+import hashlib
+import mmap
+import os
+import struct
+
+
+# On-disk cache of the per-glyph metrics that TextMetrics would otherwise get from freetype.
+#
+# There is one file per (font, size). It holds a fixed header followed by the GlyphTable columns, each padded to
+# 8 bytes. Files are memory-mapped copy-on-write when loaded, so opening a cached font copies nothing and
+# TextMetrics can still fill in glyphs the file does not have yet. A file is only used while the font file it was
+# built from is unchanged. The font's mtime and size are checked first, and the SHA-1 of its contents if they differ;
+# if the contents still match, the header is updated to the new mtime and size.
+
+# magic, format version, font mtime_ns, font file size, font size, font sha1, ascender, descender, num_glyphs
+header = struct.Struct('<4sH2xqqd20s4xddI4x')
+magic = b'TMC1'
+version = 1
+
+
+def _padded(size):
+    return (size + 7) & ~7
+
+
+def _font_sha1(font_path):
+    sha1 = hashlib.sha1()
+    with open(font_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha1.update(chunk)
+    return sha1.digest()
+
+
+class FontMetrics:
+    def __init__(self, ascender, descender, num_glyphs, columns):
+        self.ascender = ascender
+        self.descender = descender
+        self.num_glyphs = num_glyphs
+        self.columns = columns  # column name -> writable memoryview over the mapped file
+
+
+class FontMetricsStore:
+    # layout: sequence of (column name, array typecode), in file order
+    def __init__(self, cache_dir, layout):
+        self.cache_dir = cache_dir
+        self.layout = layout
+
+    def path_for(self, font_path, font_size):
+        font_path = os.path.abspath(font_path)
+        stem = os.path.splitext(os.path.basename(font_path))[0].replace(' ', '_')
+        path_hash = hashlib.sha1(font_path.encode('utf-8')).hexdigest()[:8]
+        return os.path.join(self.cache_dir, f'{stem}-{path_hash}-{font_size}.metrics')
+
+    # Map the cached metrics for the font, or return None if there are none or they are out of date.
+    def load(self, font_path, font_size):
+        path = self.path_for(font_path, font_size)
+        try:
+            font_stat = os.stat(font_path)
+            with open(path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return None
+
+        if len(mapped) < header.size:
+            return None
+        (file_magic, file_version, mtime_ns, file_size, cached_size, sha1,
+         ascender, descender, num_glyphs) = header.unpack_from(mapped)
+        if file_magic != magic or file_version != version or cached_size != font_size:
+            return None
+        if (mtime_ns, file_size) != (font_stat.st_mtime_ns, font_stat.st_size):
+            if _font_sha1(font_path) != sha1:
+                return None
+            # Same contents under a new mtime (e.g. after a checkout): record it so the hash is only taken once
+            self._refresh_header(path, header.pack(magic, version, font_stat.st_mtime_ns, font_stat.st_size,
+                                                   font_size, sha1, ascender, descender, num_glyphs))
+
+        columns = {}
+        offset = header.size
+        view = memoryview(mapped)
+        for name, typecode in self.layout:
+            nbytes = struct.calcsize(typecode) * num_glyphs
+            if offset + nbytes > len(mapped):
+                return None
+            columns[name] = view[offset:offset + nbytes].cast(typecode)
+            offset += _padded(nbytes)
+
+        return FontMetrics(ascender, descender, num_glyphs, columns)
+
+    def _refresh_header(self, path, head):
+        try:
+            with open(path, 'r+b') as f:
+                f.write(head)
+        except OSError:
+            pass
+
+    # Write the metrics for the font. columns maps each layout column name to an array or memoryview.
+    def save(self, font_path, font_size, ascender, descender, num_glyphs, columns):
+        font_stat = os.stat(font_path)
+        head = header.pack(magic, version, font_stat.st_mtime_ns, font_stat.st_size, font_size,
+                           _font_sha1(font_path), ascender, descender, num_glyphs)
+
+        path = self.path_for(font_path, font_size)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        os.makedirs(self.cache_dir, exist_ok=True)
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(head)
+                for name, typecode in self.layout:
+                    data = bytes(columns[name])
+                    f.write(data)
+                    f.write(bytes(_padded(len(data)) - len(data)))
+            # On Windows this fails while the old file is still mapped; the next run will simply rebuild it
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+        return True
+
+
+# Build step: precompile the metrics for the given fonts at the font sizes offered in the app, e.g.
+#   python font_metrics_store.py Fonts/*.ttf Fonts/*.otf
+if __name__ == '__main__':
+    import argparse
+    from kivy_text_metrics import font_cache
+
+    parser = argparse.ArgumentParser(description='Precompile TextMetrics glyph tables into the metrics cache.')
+    parser.add_argument('fonts', nargs='+')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[24, 28, 32, 36, 40, 44, 48])
+    args = parser.parse_args()
+
+    for font_path in args.fonts:
+        for font_size in args.sizes:
+            font_cache.precompile(font_path, font_size)
+            print(f'{font_path} @ {font_size}: {font_cache.store.path_for(font_path, font_size)}')
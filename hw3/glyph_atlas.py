@@ -0,0 +1,205 @@
+from itertools import accumulate
+
+from kivy.graphics import Color, Mesh
+from kivy.graphics.texture import Texture
+from kivy.properties import ListProperty
+from kivy.uix.widget import Widget
+
+from kivy_text_metrics import TextMetrics
+
+
+# Where a glyph's bitmap lives in the atlas texture, plus the offsets needed to place it relative to the pen position.
+class AtlasRegion:
+    def __init__(self, u0, v0, u1, v1, width, height, bitmap_left, bitmap_top):
+        self.tex_coords = (u0, v0, u1, v1)
+        self.width = width
+        self.height = height
+        self.bitmap_left = bitmap_left
+        self.bitmap_top = bitmap_top
+
+
+# A single shared texture that every (font, size, glyph) is rasterized into once.
+#
+# Glyphs are packed left to right into horizontal shelves. When the texture is full it is cleared and packing starts
+# over; generation is bumped so renderers know their cached regions are stale.
+class GlyphAtlas:
+    def __init__(self, size=1024, padding=1):
+        self.size = size
+        self.padding = padding
+        self.texture = Texture.create(size=(size, size), colorfmt='rgba')
+        self.generation = 0
+        self.uploads = 0
+        self.reset()
+
+    def reset(self):
+        self.texture.blit_buffer(bytes(self.size * self.size * 4), colorfmt='rgba', bufferfmt='ubyte')
+        self.regions = {}  # (font_path, font_size, glyph_id) -> AtlasRegion
+        self._shelf_x = 0
+        self._shelf_y = 0
+        self._shelf_h = 0
+        self.generation += 1
+
+    # Return the AtlasRegion for the glyph, rasterizing it into the atlas the first time it is seen.
+    def get(self, font, glyph_id):
+        key = (font.font_path, font.font_size, glyph_id)
+        region = self.regions.get(key)
+        if region is None:
+            region = self._add(font, glyph_id)
+            self.regions[key] = region
+        return region
+
+    def _add(self, font, glyph_id):
+        # Rendering the glyph leaves a grayscale coverage bitmap in the face's glyph slot
+        font.face.load_glyph(glyph_id)
+        glyph = font.face.glyph
+        bitmap = glyph.bitmap
+        width, height, pitch = bitmap.width, bitmap.rows, bitmap.pitch
+
+        if width == 0 or height == 0:
+            return AtlasRegion(0, 0, 0, 0, 0, 0, glyph.bitmap_left, glyph.bitmap_top)
+
+        x, y = self._allocate(width, height)
+
+        # White pixels with the coverage as alpha, so a Color instruction tints the glyph.
+        # freetype rows go top to bottom, texture rows bottom to top.
+        coverage = bytes(bitmap.buffer)
+        rgba = bytearray(b'\xff' * (width * height * 4))
+        for row in range(height):
+            dst = (height - 1 - row) * width * 4
+            rgba[dst + 3:dst + width * 4:4] = coverage[row * pitch:row * pitch + width]
+
+        self.texture.blit_buffer(bytes(rgba), pos=(x, y), size=(width, height), colorfmt='rgba', bufferfmt='ubyte')
+        self.uploads += 1
+
+        size = float(self.size)
+        return AtlasRegion(x / size, y / size, (x + width) / size, (y + height) / size,
+                           width, height, glyph.bitmap_left, glyph.bitmap_top)
+
+    def _allocate(self, width, height):
+        padding = self.padding
+        if width + padding > self.size or height + padding > self.size:
+            raise ValueError(f'glyph of {width}x{height} does not fit in a {self.size} atlas')
+
+        # Start a new shelf when the current one is out of room, and start over when the texture is full
+        if self._shelf_x + width + padding > self.size:
+            self._shelf_x = 0
+            self._shelf_y += self._shelf_h
+            self._shelf_h = 0
+        if self._shelf_y + height + padding > self.size:
+            self.reset()
+
+        x, y = self._shelf_x, self._shelf_y
+        self._shelf_x += width + padding
+        self._shelf_h = max(self._shelf_h, height + padding)
+        return x, y
+
+
+# The texture can only be created once there is a GL context, so the shared atlas is made on first use
+_glyph_atlas = None
+
+
+def get_glyph_atlas():
+    global _glyph_atlas
+    if _glyph_atlas is None:
+        _glyph_atlas = GlyphAtlas()
+    return _glyph_atlas
+
+
+# Draws a word as textured quads from the shared glyph atlas instead of rendering a new label texture per word.
+#
+# The glyphs are laid out with the TextMetrics (harfbuzz) advances. All quads go into one Mesh per colour: one for the
+# word and one for the focus letter, so changing the word only rewrites vertex data.
+class AtlasWordRenderer(Widget):
+    color = ListProperty([1, 1, 1, 1])
+    focus_color = ListProperty([1, 0.5, 0.5, 1])
+
+    def __init__(self, font_name, font_size, **kwargs):
+        super().__init__(**kwargs)
+        self.font_name = font_name
+        self.font_size = font_size
+        self.word = ''
+        self.focus_idx = 0
+        self.advance_to_focus = 0.0  # advance from the start of the word to the end of the focus glyph
+        self.focus_advance = 0.0
+        self.ascender = 0.0
+        self.descender = 0.0
+
+        with self.canvas:
+            self.word_color = Color(*self.color)
+            self.word_mesh = Mesh(mode='triangles')
+            self.focus_color_instr = Color(*self.focus_color)
+            self.focus_mesh = Mesh(mode='triangles')
+
+        self.bind(color=lambda instance, value: setattr(self.word_color, 'rgba', value),
+                  focus_color=lambda instance, value: setattr(self.focus_color_instr, 'rgba', value),
+                  pos=self.update_quads)
+
+    def set_font(self, font_name, font_size):
+        self.font_name = font_name
+        self.font_size = font_size
+        self.set_word(self.word, self.focus_idx)
+
+    # Lay out the word with the glyph at character focus_idx drawn in focus_color.
+    def set_word(self, word, focus_idx):
+        self.word = word
+        self.focus_idx = focus_idx
+
+        metrics = TextMetrics(self.font_name, self.font_size)
+        glyph_attribs, text_width = metrics.shape(word)
+        self.font = metrics.font
+        self.glyph_attribs = glyph_attribs
+        self.ascender = metrics.font.ascender
+        self.descender = metrics.font.descender
+        self.size = (text_width, self.ascender - self.descender)
+
+        self.pen_x = [0.0]
+        self.pen_x.extend(accumulate(glyph_attribs.x_advance))
+        self.focus_glyph = glyph_attribs.glyph_for_char(focus_idx) if word else -1
+        if 0 <= self.focus_glyph < len(glyph_attribs):
+            self.advance_to_focus = self.pen_x[self.focus_glyph + 1]
+            self.focus_advance = glyph_attribs.x_advance[self.focus_glyph]
+        else:
+            self.advance_to_focus = self.focus_advance = 0.0
+
+        self.update_quads()
+
+    # Place the word so the middle of its focus glyph is at (center_x, center_y)
+    def center_on_focus(self, center_x, center_y):
+        self.pos = (center_x - self.advance_to_focus + self.focus_advance / 2, center_y - self.height / 2)
+
+    def update_quads(self, *args):
+        if not self.word:
+            self.word_mesh.vertices, self.word_mesh.indices = [], []
+            self.focus_mesh.vertices, self.focus_mesh.indices = [], []
+            return
+
+        atlas = get_glyph_atlas()
+        generation = atlas.generation
+        quads = self._build_quads(atlas)
+        if atlas.generation != generation:
+            # The atlas was cleared part way through, so earlier regions are gone; lay out again
+            quads = self._build_quads(atlas)
+
+        (word_vertices, word_indices), (focus_vertices, focus_indices) = quads
+        self.word_mesh.texture = self.focus_mesh.texture = atlas.texture
+        self.word_mesh.vertices, self.word_mesh.indices = word_vertices, word_indices
+        self.focus_mesh.vertices, self.focus_mesh.indices = focus_vertices, focus_indices
+
+    def _build_quads(self, atlas):
+        meshes = ([], []), ([], [])
+        baseline = self.y - self.descender
+
+        for i, glyph_id in enumerate(self.glyph_attribs.glyph_ids):
+            region = atlas.get(self.font, glyph_id)
+            if region.width == 0: continue
+
+            vertices, indices = meshes[1] if i == self.focus_glyph else meshes[0]
+            x0 = self.x + self.pen_x[i] + region.bitmap_left
+            y1 = baseline + region.bitmap_top
+            x1, y0 = x0 + region.width, y1 - region.height
+            u0, v0, u1, v1 = region.tex_coords
+
+            n = len(vertices) // 4
+            vertices.extend((x0, y0, u0, v0, x1, y0, u1, v0, x1, y1, u1, v1, x0, y1, u0, v1))
+            indices.extend((n, n + 1, n + 2, n, n + 2, n + 3))
+        return meshes
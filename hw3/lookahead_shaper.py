@@ -0,0 +1,85 @@
+import threading
+
+from kivy_text_metrics import FontCache, TextMetrics, font_cache
+
+# freetype faces are not thread safe, so the workers share a FontCache of their own instead of the main one. It
+# lives for the whole session like the main cache, so a new shaper (new document, font or size) reuses the faces
+# that are already open. It reads glyph tables from the shared on-disk store, but never writes them. An old
+# shaper's thread can still be finishing a chunk when a new one starts, so the cache is only used under worker_lock.
+worker_cache = FontCache(store=font_cache.store, read_only=True)
+worker_lock = threading.Lock()
+
+
+# Keeps a window of upcoming words shaped on a background thread.
+#
+# The reader tells the shaper where it is with move_to(); the worker shapes the words from there up to window words
+# ahead, a chunk at a time, and anything that falls outside the window is dropped. Moving somewhere outside the
+# current window (a seek) simply makes the worker start filling again from the new position.
+class LookaheadShaper:
+    def __init__(self, words, font_path, font_size, window=64, chunk=8):
+        self.words = words
+        self.window = window
+        self.chunk = chunk
+        self.font_path = font_path
+        self.font_size = font_size
+
+        self._results = {}  # word index -> (ShapedDocument, index of the word within it)
+        self._position = 0
+        self._stopped = False
+        self._cond = threading.Condition()
+
+        self._thread = threading.Thread(target=self._run, name='lookahead-shaper', daemon=True)
+        self._thread.start()
+
+    # The finished shaping result for word idx as (ShapedDocument, index within it), or None if not ready yet
+    def take(self, idx):
+        with self._cond:
+            return self._results.get(idx)
+
+    # Move the window to start at word idx
+    def move_to(self, idx):
+        with self._cond:
+            self._position = idx
+            end = idx + self.window
+            for word_idx in [i for i in self._results if not idx <= i < end]:
+                del self._results[word_idx]
+            self._cond.notify()
+
+    # With wait, also wait for the worker to finish the chunk it may be shaping, after which words is no longer used
+    def stop(self, wait=False):
+        with self._cond:
+            self._stopped = True
+            self._results.clear()
+            self._cond.notify()
+        if wait:
+            self._thread.join()
+
+    def _next_missing(self):
+        end = min(self._position + self.window, len(self.words))
+        for idx in range(self._position, end):
+            if idx not in self._results:
+                return idx, min(idx + self.chunk, end)
+        return None
+
+    def _run(self):
+        with worker_lock:
+            metrics = TextMetrics(self.font_path, self.font_size, cache=worker_cache)
+
+        while True:
+            with self._cond:
+                missing = self._next_missing()
+                while missing is None and not self._stopped:
+                    self._cond.wait()
+                    missing = self._next_missing()
+                if self._stopped: return
+
+            # Shape outside the lock so the main thread never waits on it
+            start, end = missing
+            with worker_lock:
+                doc = metrics.get_text_extents_many(self.words[start:end])
+
+            with self._cond:
+                window_end = self._position + self.window
+                for i in range(end - start):
+                    if self._position <= start + i < window_end:
+                        self._results.setdefault(start + i, (doc, i))
@@ -0,0 +1,54 @@
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, islice
+
+
+# When each word of the document is shown, for a given reading speed.
+#
+# A word is shown for len(word) / chars_per_word words' worth of time, so every duration is the word's length times
+# one seconds-per-character factor. The timeline only stores the running total of characters up to the end of each
+# word; durations and start times are that prefix sum times the factor. Changing the WPM just changes the factor, and
+# finding the word at a given time is a binary search of the prefix sum.
+class PlaybackTimeline:
+    def __init__(self, wpm, chars_per_word=2.5):
+        self.chars_per_word = chars_per_word
+        self.char_ends = array('I')  # total characters up to and including word i, 8 bytes each only past 4G
+        self.set_wpm(wpm)
+
+    def __len__(self):
+        return len(self.char_ends)
+
+    def set_wpm(self, wpm):
+        self.wpm = wpm
+        self.sec_per_char = 60 / (wpm * self.chars_per_word)
+
+    # Append words by their lengths in characters
+    def extend(self, char_lengths):
+        last = self.char_ends[-1] if self.char_ends else 0
+        # accumulate() yields the initial value first, skip it
+        char_ends = list(islice(accumulate(char_lengths, initial=last), 1, None))
+        if char_ends and char_ends[-1] >= 1 << 32 and self.char_ends.typecode == 'I':
+            self.char_ends = array('Q', self.char_ends)
+        self.char_ends.extend(char_ends)
+
+    def start_time(self, idx):
+        return self.char_ends[idx - 1] * self.sec_per_char if idx > 0 else 0.0
+
+    def end_time(self, idx):
+        return self.char_ends[idx] * self.sec_per_char
+
+    def duration(self, idx):
+        return self.end_time(idx) - self.start_time(idx)
+
+    def total_time(self):
+        return self.end_time(len(self) - 1) if self.char_ends else 0.0
+
+    # The word being shown at time t (seconds from the start), clamped to the document
+    def index_at(self, t):
+        if not self.char_ends: return 0
+        idx = bisect_right(self.char_ends, t / self.sec_per_char)
+        return min(max(idx, 0), len(self) - 1)
+
+    # The word shown seconds from now, when word idx has just been shown (seconds may be negative)
+    def seek(self, idx, seconds):
+        return self.index_at(self.start_time(idx) + seconds)
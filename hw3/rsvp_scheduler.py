@@ -0,0 +1,114 @@
+import time
+
+from kivy.clock import Clock
+
+
+# Drives RSVP playback from a PlaybackTimeline instead of chaining one Clock callback per word.
+#
+# Playback is anchored to a monotonic start time. Every frame the scheduler works out which word the timeline says
+# should be on screen now and shows it if it changed, so frame latency never adds up: a late frame just means the
+# next word comes up a little later, not that every following word does. The single Clock event is kept and can be
+# cancelled with stop() (or Clock.unschedule(scheduler.tick)).
+#
+# on_word(idx) is called whenever a new word should be shown, and on_finished() once the last word is reached.
+# is_complete() tells the scheduler whether the timeline may still grow (the document is still being indexed), in
+# which case it waits at the last known word rather than finishing.
+class RSVPScheduler:
+    def __init__(self, timeline, on_word, on_finished=None, is_complete=None, before_tick=None):
+        self.timeline = timeline
+        self.on_word = on_word
+        self.on_finished = on_finished
+        self.is_complete = is_complete
+        self.before_tick = before_tick
+        self.clock = time.perf_counter
+
+        self._event = None
+        self._anchor = 0.0  # clock time at which the document's timeline starts
+        self._sec_per_char = timeline.sec_per_char
+        self.idx = -1
+
+        # For achieved vs. target WPM
+        self._stats_start_idx = 0
+        self._stats_start_time = 0.0
+        self._stats_last_time = 0.0
+        self.words_shown = 0
+
+    @property
+    def running(self):
+        return self._event is not None
+
+    # Start playback with word idx shown now
+    def start(self, idx):
+        self.stop()
+        self._reanchor(idx)
+        self._reset_stats(idx)
+        self._event = Clock.schedule_interval(self.tick, 0)
+        self.tick(0)
+
+    def stop(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    # Jump to word idx, keeping playback running if it is
+    def seek(self, idx):
+        self._reanchor(idx)
+        self._reset_stats(idx)
+        if self.running:
+            self.tick(0)
+
+    # Clock time at which word idx is due on screen under the current anchor
+    def scheduled_time(self, idx):
+        return self._anchor + self.timeline.start_time(idx)
+
+    def tick(self, dt):
+        if self.before_tick is not None: self.before_tick()
+        timeline = self.timeline
+        if len(timeline) < 1: return
+        now = self.clock()
+
+        # The WPM changed: keep the current position in the document and continue at the new speed
+        if timeline.sec_per_char != self._sec_per_char:
+            chars = (now - self._anchor) / self._sec_per_char
+            self._anchor = now - chars * timeline.sec_per_char
+            self._sec_per_char = timeline.sec_per_char
+            self._reset_stats(self.idx)
+
+        last = len(timeline) - 1
+        complete = self.is_complete is None or self.is_complete()
+        if not complete and now - self._anchor > timeline.end_time(last):
+            # Caught up with the words indexed so far; hold the timeline at the end of the last one
+            self._anchor = now - timeline.end_time(last)
+
+        idx = timeline.index_at(now - self._anchor)
+        if idx != self.idx:
+            self.idx = idx
+            self.words_shown += 1
+            self._stats_last_time = now
+            self.on_word(idx)
+
+        if complete and idx == last:
+            self.stop()
+            if self.on_finished is not None: self.on_finished()
+
+    def _reanchor(self, idx):
+        self._sec_per_char = self.timeline.sec_per_char
+        self._anchor = self.clock() - self.timeline.start_time(idx)
+        self.idx = idx - 1
+
+    def _reset_stats(self, idx):
+        self._stats_start_idx = max(idx, 0)
+        self._stats_start_time = self._stats_last_time = self.clock()
+        self.words_shown = 0
+
+    # The reading speed actually achieved since the last start, seek or WPM change, in the same units as the
+    # timeline's WPM setting: the WPM setting scaled by how long the shown words should have taken vs. how long they did
+    def stats(self):
+        target_wpm = self.timeline.wpm
+        elapsed = self._stats_last_time - self._stats_start_time
+        planned = 0.0
+        if self.idx > self._stats_start_idx:
+            planned = self.timeline.start_time(self.idx) - self.timeline.start_time(self._stats_start_idx)
+        achieved_wpm = target_wpm * planned / elapsed if elapsed > 0 else target_wpm
+        return {'words_shown': self.words_shown, 'elapsed': elapsed, 'planned': planned,
+                'target_wpm': target_wpm, 'achieved_wpm': achieved_wpm}
@@ -0,0 +1,57 @@
+from kivy.clock import Clock
+from kivy.core.text.markup import MarkupLabel
+
+
+# Renders the textures of the next few words off-screen before they are shown.
+#
+# A label renders its texture on the frame after its text changes, so every word change costs a full render during
+# playback. The queue renders the words from the current position up to depth words ahead into core label textures
+# instead, a few per frame (per_frame) while there is idle time, so showing a word only means swapping the texture
+# on the label. markup_for(word) gives the text to render for a word, e.g. with its focus letter marked up.
+#
+# Textures belong to one font and size; make a new queue (and stop() the old one) when either changes.
+class WordTextureQueue:
+    def __init__(self, words, markup_for, font_name, font_size, color=(1, 1, 1, 1), depth=8, per_frame=2):
+        self.words = words
+        self.markup_for = markup_for
+        self.label_options = {'font_name': font_name, 'font_size': font_size, 'color': color}
+        self.depth = depth
+        self.per_frame = per_frame
+
+        self._textures = {}  # word index -> (markup text, texture)
+        self._position = 0
+        self._fill_trigger = Clock.create_trigger(self._fill)
+
+    # The pre-rendered (markup text, texture) for word idx, or None if it is not ready yet
+    def take(self, idx):
+        return self._textures.get(idx)
+
+    # Move the queue to start at word idx and top it up from there
+    def move_to(self, idx):
+        self._position = idx
+        end = idx + self.depth
+        for word_idx in [i for i in self._textures if not idx <= i < end]:
+            del self._textures[word_idx]
+        self._fill_trigger()
+
+    def stop(self):
+        self._fill_trigger.cancel()
+        self._textures.clear()
+
+    def render(self, text):
+        label = MarkupLabel(text=text, **self.label_options)
+        label.refresh()
+        return label.texture
+
+    def _fill(self, dt):
+        end = min(self._position + self.depth, len(self.words))
+        rendered = 0
+        for idx in range(self._position, end):
+            if idx in self._textures: continue
+            if rendered == self.per_frame:
+                # more to do; carry on next frame so a single frame never renders the whole queue
+                self._fill_trigger()
+                return
+            text = self.markup_for(self.words[idx])
+            self._textures[idx] = text, self.render(text)
+            rendered += 1
@@ -0,0 +1,152 @@
+import os
+import threading
+from fnmatch import fnmatch
+
+from kivy.clock import Clock, mainthread
+from kivy.metrics import dp
+from kivy.properties import BooleanProperty, ListProperty, ObjectProperty, StringProperty
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.label import Label
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+
+# Entries posted to the view at a time while a directory is being scanned
+batch_size = 256
+
+# (directory, filters) -> (directory mtime_ns, sorted entries); an entry is a (name, is_dir) pair
+listing_cache = {}
+
+
+def sort_entries(entries):
+    return sorted(entries, key=lambda entry: (not entry[1], entry[0].lower()))
+
+
+# The matching files and the subdirectories of path, without hidden entries, straight from os.scandir.
+# Yields lists of at most batch_size entries as they are found, unsorted.
+def scan_directory(path, filters, cancelled):
+    batch = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if cancelled(): return
+            if entry.name.startswith('.'): continue
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if not is_dir and filters and not any(fnmatch(entry.name, pattern) for pattern in filters): continue
+            batch.append((entry.name, is_dir))
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+    if batch: yield batch
+
+
+# One row of the listing
+class FileEntry(Button):
+    entry_path = StringProperty('')
+    is_dir = BooleanProperty(False)
+    chooser = ObjectProperty(None, allownone=True)
+
+    def on_release(self):
+        self.chooser.open_entry(self.entry_path, self.is_dir)
+
+
+# A file list that never blocks the UI while a directory is read.
+#
+# Directories are scanned on a background thread and the entries are added to a RecycleView in batches as they are
+# found, so the first files show up right away and only the visible rows are ever built as widgets. Once a scan has
+# finished, the listing is sorted (directories first) and cached; it is reused for as long as the directory's mtime
+# is unchanged, which makes reopening the chooser on the same directory instant.
+#
+# Works like FileChooserListView from kv: set path and filters, and selection holds the chosen file.
+class AsyncFileChooser(BoxLayout):
+    path = StringProperty(os.getcwd())
+    filters = ListProperty([])
+    selection = ListProperty([])
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation='vertical', **kwargs)
+        self._generation = 0
+        self._head = []  # the ../ row, if any
+
+        self.path_label = Label(size_hint_y=None, height=dp(32), halign='left', valign='middle')
+        self.path_label.bind(size=self.path_label.setter('text_size'))
+        self.add_widget(self.path_label)
+
+        self.view = RecycleView(viewclass=FileEntry)
+        layout = RecycleBoxLayout(orientation='vertical', size_hint_y=None,
+                                  default_size=(None, dp(32)), default_size_hint=(1, None))
+        layout.bind(minimum_height=layout.setter('height'))
+        self.view.add_widget(layout)
+        self.add_widget(self.view)
+
+        self._refresh_trigger = Clock.create_trigger(self.refresh)
+        self.bind(path=self._refresh_trigger, filters=self._refresh_trigger)
+        self._refresh_trigger()
+
+    def open_entry(self, entry_path, is_dir):
+        if is_dir:
+            self.path = entry_path
+        else:
+            self.selection = [entry_path]
+
+    # List the current directory, from the cache when it is still up to date
+    def refresh(self, *args):
+        self._generation += 1
+        generation = self._generation
+        path = os.path.abspath(self.path)
+        self.path_label.text = path
+
+        parent = os.path.dirname(path)
+        self._head = [self._row('../', parent, True)] if parent != path else []
+        self.view.data = list(self._head)
+
+        key = (path, tuple(self.filters))
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError as e:
+            print(f"Error: {e}")
+            return
+
+        cached = listing_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            self.view.data.extend(self._rows(path, cached[1]))
+            return
+
+        threading.Thread(target=self._scan, args=(path, key, mtime, generation),
+                         name='file-chooser-scan', daemon=True).start()
+
+    def _scan(self, path, key, mtime, generation):
+        cancelled = lambda: generation != self._generation
+        entries = []
+        try:
+            for batch in scan_directory(path, key[1], cancelled):
+                entries.extend(batch)
+                self._add_batch(generation, path, batch)
+        except OSError as e:
+            print(f"Error: {e}")
+            return
+        if cancelled(): return
+
+        entries = sort_entries(entries)
+        listing_cache[key] = (mtime, entries)
+        self._finish(generation, path, entries)
+
+    @mainthread
+    def _add_batch(self, generation, path, batch):
+        if generation != self._generation: return
+        self.view.data.extend(self._rows(path, batch))
+
+    # Replace the unsorted batches with the sorted listing
+    @mainthread
+    def _finish(self, generation, path, entries):
+        if generation != self._generation: return
+        self.view.data = self._head + self._rows(path, entries)
+
+    def _rows(self, path, entries):
+        return [self._row(f'{name}/' if is_dir else name, os.path.join(path, name), is_dir)
+                for name, is_dir in entries]
+
+    def _row(self, text, entry_path, is_dir):
+        return {'text': text, 'entry_path': entry_path, 'is_dir': is_dir, 'chooser': self}
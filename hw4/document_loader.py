@@ -0,0 +1,235 @@
+import mmap
+import re
+import threading
+from array import array
+
+word_pattern = re.compile(rb'\S+')
+space_pattern = re.compile(rb'\s')
+
+# Unsigned array typecodes, narrowest first
+unsigned_types = ('B', 'H', 'I', 'Q')
+
+
+def fits(typecode, value):
+    return value < 1 << (8 * array(typecode).itemsize)
+
+
+# values, or a copy of it with the narrowest wider typecode that holds largest. The indexer swaps the copy in
+# before it appends, so readers on other threads only ever see a complete array.
+def widened(values, largest):
+    typecode = values.typecode
+    while not fits(typecode, largest):
+        typecode = unsigned_types[unsigned_types.index(typecode) + 1]
+    return values if typecode == values.typecode else array(typecode, values)
+
+
+# The offsets and lengths of the words of an index, in arrays that are only as wide as the values need.
+#
+# Words are only visible once their length is in lengths, so it is always extended last.
+class WordArrays:
+    def __init__(self, offset_type):
+        self.offsets = array(offset_type)
+        self.lengths = array('B')
+        self._char_lengths = None  # only once some word's character and byte lengths differ
+
+    def __len__(self):
+        return len(self.lengths)
+
+    # The lengths in characters of words start to end
+    def char_lengths(self, start, end):
+        char_lengths = self._char_lengths
+        return (self.lengths if char_lengths is None else char_lengths)[start:end]
+
+    # Append the byte lengths and, if they differ from those, character lengths of new words
+    def _add_lengths(self, lengths, char_lengths):
+        if char_lengths == lengths:
+            char_lengths = None
+        if char_lengths is not None and self._char_lengths is None:
+            # Every word so far has the same length in bytes and characters
+            self._char_lengths = array(self.lengths.typecode, self.lengths)
+        if self._char_lengths is not None:
+            char_lengths = lengths if char_lengths is None else char_lengths
+            self._char_lengths = widened(self._char_lengths, max(char_lengths, default=0))
+            self._char_lengths.extend(char_lengths)
+
+        self.lengths = widened(self.lengths, max(lengths, default=0))
+        self.lengths.extend(lengths)
+
+
+# The words of a text file, indexed lazily straight from a memory map.
+#
+# Instead of reading the file and splitting it into a list of strings, the index only stores an (offset, length)
+# pair per word in compact arrays, and a word is decoded when it is asked for. Offsets are 4 bytes for files under
+# 4 GiB, and lengths start at 1 byte and are only widened when a longer word comes along, so a typical word costs
+# 5 bytes. char_lengths() gives each word's length in characters (what len(word) would give), for timing playback
+# without decoding; a separate array for it is only kept once a word's character and byte lengths differ, i.e. for
+# non-ASCII text. The first chunk of the file is indexed right away so reading can start immediately; the rest is
+# indexed on a background thread, during which len() keeps growing until done is set.
+#
+# Words are split on ASCII whitespace, which matches str.split() for everything but the rarer Unicode spaces.
+class WordIndex(WordArrays):
+    def __init__(self, path, encoding='utf-8', first_chunk=1 << 16, chunk=1 << 20):
+        self.path = path
+        self.encoding = encoding
+        self.chunk = chunk
+        self.done = False
+        self._closed = False
+
+        with open(path, 'rb') as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # mmap refuses empty files
+                self._map = b''
+        super().__init__('I' if fits('I', len(self._map)) else 'Q')
+
+        self._pos = self._index(0, first_chunk)
+        if self._pos >= len(self._map):
+            self.done = True
+            self._thread = None
+        else:
+            self._thread = threading.Thread(target=self._run, name='word-index', daemon=True)
+            self._thread.start()
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+
+        offset = self.offsets[i]
+        return self._map[offset:offset + self.lengths[i]].decode(self.encoding, errors='replace')
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    # Stop indexing and release the file
+    def close(self):
+        self._closed = True
+        if self._thread is not None:
+            self._thread.join()
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+    def _run(self):
+        while self._pos < len(self._map) and not self._closed:
+            self._pos = self._index(self._pos, self.chunk)
+        self.done = True
+
+    # Index the words in about size bytes starting at start, and return where the next chunk starts.
+    # The chunk is extended to the next whitespace so no word is ever split in two.
+    def _index(self, start, size):
+        data = self._map
+        end = start + size
+        if end >= len(data):
+            end = len(data)
+        else:
+            space = space_pattern.search(data, end)
+            end = space.start() if space else len(data)
+
+        offsets = array(self.offsets.typecode)
+        lengths = []
+        for match in word_pattern.finditer(data, start, end):
+            offsets.append(match.start())
+            lengths.append(match.end() - match.start())
+
+        # Byte and character lengths only differ when the chunk has non-ASCII text
+        char_lengths = None
+        if not data[start:end].isascii():
+            char_lengths = [len(data[o:o + n].decode(self.encoding, errors='replace'))
+                            for o, n in zip(offsets, lengths)]
+
+        self.offsets.extend(offsets)
+        self._add_lengths(lengths, char_lengths)
+        return end
+
+
+
+# The words of a document that has to be decoded on the way in (compressed text, EPUB), indexed as it streams.
+#
+# chunks is an iterable of str pieces of the document in reading order, e.g. from document_sources. The pieces are
+# split into words and the words appended, UTF-8 encoded and back to back, to one growing bytearray; offsets,
+# lengths and char_lengths() work as in WordIndex, with offsets widened to 8 bytes once the words pass 4 GiB. The words of the whole document are kept that way for as long as
+# the index is open, but nothing else: the compressed file or the EPUB markup and whitespace is only ever held one
+# chunk at a time. The first chunks are indexed right away, at least until there is a word to show, and the rest on
+# a background thread.
+class StreamWordIndex(WordArrays):
+    def __init__(self, chunks, first_chunks=1):
+        super().__init__('I')
+        self.done = False
+        self._closed = False
+
+        self._data = bytearray()
+        self._carry = ''  # a word cut in two by the end of the last chunk
+        self._chunks = iter(chunks)
+
+        # An EPUB often starts with a cover or title page without any text, so keep going until there is a word
+        chunks_read = 0
+        while chunks_read < first_chunks or not len(self):
+            if not self._index_next():
+                self._finish()
+                self._thread = None
+                return
+            chunks_read += 1
+        self._thread = threading.Thread(target=self._run, name='word-index', daemon=True)
+        self._thread.start()
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+
+        offset = self.offsets[i]
+        return self._data[offset:offset + self.lengths[i]].decode('utf-8')
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    # Stop indexing and release the source
+    def close(self):
+        self._closed = True
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        try:
+            while not self._closed and self._index_next():
+                pass
+        finally:
+            self._finish()
+
+    def _finish(self):
+        if not self._closed and self._carry:
+            self._add_words([self._carry])
+        self._carry = ''
+        if hasattr(self._chunks, 'close'):
+            self._chunks.close()
+        self.done = True
+
+    # Index the next chunk, returning False once the source is exhausted
+    def _index_next(self):
+        chunk = next(self._chunks, None)
+        if chunk is None: return False
+
+        text = self._carry + chunk
+        words = text.split()
+        self._carry = ''
+        if words and not text[-1].isspace():
+            self._carry = words.pop()
+        self._add_words(words)
+        return True
+
+    def _add_words(self, words):
+        offsets = []
+        lengths = []
+        char_lengths = []
+        data = self._data
+        for word in words:
+            encoded = word.encode('utf-8')
+            offsets.append(len(data))
+            lengths.append(len(encoded))
+            char_lengths.append(len(word))
+            data += encoded
+
+        self.offsets = widened(self.offsets, len(data))
+        self.offsets.extend(offsets)
+        self._add_lengths(lengths, char_lengths)
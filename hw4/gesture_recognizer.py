@@ -0,0 +1,178 @@
+import time
+from array import array
+
+import numpy as np
+
+from playback_telemetry import percentile
+
+# Points every stroke is resampled to before it is compared
+num_points = 64
+
+# Templates are also compared rotated by these angles, so a slightly tilted stroke still matches. The search is kept
+# bounded on purpose: the arrows only differ by rotation, so an up arrow must never match a right arrow.
+rotations = np.radians(np.arange(-30, 31, 5))
+
+# Largest mean distance two normalized strokes can reasonably have (half the diagonal of the unit square)
+max_distance = 0.5 * np.sqrt(2)
+
+
+# The points of a stroke as an (N, 2) float array. Takes a kivy Gesture (all of its strokes, in order), a flat
+# [x0, y0, x1, y1, ...] sequence such as Line.points, or anything NumPy sees as N (x, y) pairs.
+def as_points(stroke):
+    if hasattr(stroke, 'strokes'):
+        return np.array([(p.x, p.y) for s in stroke.strokes for p in s.points], dtype=float).reshape(-1, 2)
+    points = np.asarray(stroke, dtype=float)
+    if points.ndim == 1:
+        points = points[:len(points) - len(points) % 2].reshape(-1, 2)
+    return points
+
+
+# num_points points spaced evenly along the path of the stroke
+def resample(points, n=num_points):
+    along = np.concatenate(([0.0], np.cumsum(np.hypot(*np.diff(points, axis=0).T))))
+    if along[-1] == 0:
+        return np.repeat(points[:1], n, axis=0)
+    t = np.linspace(0.0, along[-1], n)
+    return np.column_stack((np.interp(t, along, points[:, 0]), np.interp(t, along, points[:, 1])))
+
+
+# Resampled, centred on the origin and uniformly scaled so its longest side is 1. The aspect ratio is kept, so a
+# straight line stays a line instead of being stretched into a box.
+def normalize(points, n=num_points):
+    points = resample(points, n)
+    points -= points.mean(axis=0)
+    extent = np.ptp(points, axis=0).max()
+    if extent > 0:
+        points /= extent
+    return points
+
+
+# A $1-style template recognizer.
+#
+# Every template is normalized once when it is added and stored, along with its copies at each of the rotations,
+# in a single (templates, rotations, num_points, 2) matrix. Recognizing a stroke is then one normalize and one
+# vectorized distance computation against the whole matrix, however many templates there are.
+#
+# find() takes the place of GestureDatabase.find(), but returns the name the template was added under instead of
+# the template itself, so callers can dispatch on it without comparing Gestures.
+class GestureRecognizer:
+    def __init__(self):
+        self.names = []
+        self.templates = np.empty((0, len(rotations), num_points, 2))
+
+        cos, sin = np.cos(rotations), np.sin(rotations)
+        self._rotation_matrices = np.stack((np.stack((cos, -sin), axis=1), np.stack((sin, cos), axis=1)), axis=1)
+
+    def __len__(self):
+        return len(self.names)
+
+    def add_gesture(self, name, stroke):
+        template = normalize(as_points(stroke))
+        rotated = np.einsum('rij,nj->rni', self._rotation_matrices, template)
+        self.templates = np.concatenate((self.templates, rotated[np.newaxis]))
+        self.names.append(name)
+
+    # The score, between 0 and 1, of the stroke against every template, in the order they were added
+    def scores(self, stroke):
+        points = as_points(stroke)
+        if len(points) < 2 or not self.names:
+            return np.zeros(len(self.names))
+        candidate = normalize(points)
+        distances = np.sqrt(((self.templates - candidate) ** 2).sum(axis=3)).mean(axis=2).min(axis=1)
+        return np.clip(1.0 - distances / max_distance, 0.0, 1.0)
+
+    # (score, name) of the best matching template, or None if no template scores at least minscore
+    def find(self, stroke, minscore=0.85):
+        scores = self.scores(stroke)
+        if len(scores) == 0: return None
+        best = int(scores.argmax())
+        if scores[best] < minscore: return None
+        return float(scores[best]), self.names[best]
+
+
+# Scores a stroke while it is still being drawn, so a gesture can act before the finger is lifted.
+#
+# Every step new points the whole partial stroke is scored again against all templates, and each template's score
+# is folded into a running score (an exponential moving average, so one lucky update cannot win on its own). The
+# scores are not accumulated point by point: normalizing resamples, centres and scales the stroke as a whole, so
+# every new point moves all of the resampled points and any per-template distance kept from earlier would be
+# stale. Re-scoring costs about as much as the template comparison alone (the part that grows with the stroke is
+# the resampling, a few percent of it even at a thousand points), and the scores stay the ones find() gives at the
+# end. update() returns the current (name, score, margin) for the UI to show, where margin is how far the leader is
+# ahead of the runner-up.
+#
+# should_commit() is True once a template in early_commit has led for stable_updates updates in a row with a
+# running score of at least commit_score and a margin of at least margin. Only gestures that are not the start of
+# another gesture belong in early_commit: a closed circle can commit early, but the first half of an arrow is a line.
+#
+# latencies and early_by collect how long recognizing plus acting took after the event that completed a gesture,
+# and how long before the touch ended an early commit acted.
+class InFlightRecognizer:
+    def __init__(self, recognizer, early_commit=(), min_points=16, step=4, commit_score=0.9, margin=0.1,
+                 stable_updates=3, smoothing=0.5):
+        self.recognizer = recognizer
+        self.early_commit = set(early_commit)
+        self.min_points = min_points
+        self.step = step
+        self.commit_score = commit_score
+        self.margin = margin
+        self.stable_updates = stable_updates
+        self.smoothing = smoothing
+
+        self.latencies = array('d')
+        self.early_by = array('d')
+        self.begin()
+
+    # Start a new stroke
+    def begin(self):
+        self.running = None
+        self.confidence = None
+        self._scored_points = 0
+        self._leader = None
+        self._lead_updates = 0
+
+    # Score the stroke so far if enough new points came in; returns (name, score, margin) when it did, else None
+    def update(self, points):
+        count = len(points)
+        if count < self.min_points or count - self._scored_points < self.step or not len(self.recognizer):
+            return None
+        self._scored_points = count
+
+        scores = self.recognizer.scores(points)
+        if self.running is None:
+            self.running = scores
+        else:
+            self.running = self.smoothing * self.running + (1 - self.smoothing) * scores
+
+        best = int(self.running.argmax())
+        runner_up = np.partition(self.running, -2)[-2] if len(self.running) > 1 else 0.0
+        if best == self._leader:
+            self._lead_updates += 1
+        else:
+            self._leader, self._lead_updates = best, 1
+
+        self.confidence = (self.recognizer.names[best], float(self.running[best]),
+                           float(self.running[best] - runner_up))
+        return self.confidence
+
+    def should_commit(self):
+        if self.confidence is None: return False
+        name, score, margin = self.confidence
+        return (name in self.early_commit and self._lead_updates >= self.stable_updates and
+                score >= self.commit_score and margin >= self.margin)
+
+    # A gesture acted; event_time is the perf_counter time of the touch event that completed it
+    def record_action(self, event_time):
+        self.latencies.append(time.perf_counter() - event_time)
+
+    # An early commit acted this many seconds before the touch ended
+    def record_early(self, seconds):
+        self.early_by.append(seconds)
+
+    # Percentiles of the gesture-to-action latency and of the time saved by early commits, in milliseconds
+    def latency_summary(self):
+        latencies = sorted(self.latencies)
+        early_by = sorted(self.early_by)
+        return {'gestures': len(latencies), 'latency_p50_ms': percentile(latencies, 0.50) * 1e3,
+                'latency_p99_ms': percentile(latencies, 0.99) * 1e3, 'early_commits': len(early_by),
+                'early_by_p50_ms': percentile(early_by, 0.50) * 1e3}
@@ -0,0 +1,132 @@
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from gesture_recognizer import GestureRecognizer, num_points, rotations
+
+# Precompiled gesture templates, so startup never has to decode and normalize the strings in my_gestures.
+#
+# The file holds a fixed header, the template names (UTF-8, newline separated), the rotation angles and then the
+# recognizer's template matrix as little-endian doubles, each part padded to 8 bytes. Loading memory-maps the file
+# and wraps the matrix in a NumPy array without copying it. A file is only used while my_gestures.py is unchanged
+# and the recognizer still resamples and rotates templates the way the file was built with.
+
+# magic, format version, num_points, number of rotations, number of templates, names size, my_gestures mtime_ns, size
+header = struct.Struct('<4sHHIIIqq')
+magic = b'GTS1'
+version = 1
+
+here = os.path.dirname(os.path.abspath(__file__))
+store_path = os.path.join(here, 'gesture_templates.bin')
+source_path = os.path.join(here, 'my_gestures.py')
+
+
+# The gestures the app reacts to, in the order they are matched
+app_gestures = [
+    'right_arrow', 'left_arrow', 'up_arrow', 'down_arrow',
+    'cross',  # increase font size
+    'line',  # decrease font size
+    'circle',  # pause/play
+]
+
+
+def _padded(size):
+    return (size + 7) & ~7
+
+
+def save(recognizer, path=store_path):
+    source_stat = os.stat(source_path)
+    names = '\n'.join(recognizer.names).encode('utf-8')
+    head = header.pack(magic, version, num_points, len(rotations), len(recognizer.names), len(names),
+                       source_stat.st_mtime_ns, source_stat.st_size)
+
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(head)
+            for data in (names, rotations.astype('<f8').tobytes(), recognizer.templates.astype('<f8').tobytes()):
+                f.write(data)
+                f.write(bytes(_padded(len(data)) - len(data)))
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+    return True
+
+
+# A recognizer over the stored templates, or None if there is no usable file
+def load(path=store_path):
+    try:
+        source_stat = os.stat(source_path)
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(mapped) < header.size:
+        return None
+    (file_magic, file_version, file_points, file_rotations, count, names_size,
+     mtime_ns, source_size) = header.unpack_from(mapped)
+    if file_magic != magic or file_version != version:
+        return None
+    if (file_points, file_rotations) != (num_points, len(rotations)):
+        return None
+    if (mtime_ns, source_size) != (source_stat.st_mtime_ns, source_stat.st_size):
+        return None
+
+    offset = header.size
+    names = mapped[offset:offset + names_size].decode('utf-8').split('\n') if count else []
+    offset += _padded(names_size)
+    if not np.array_equal(np.frombuffer(mapped, dtype='<f8', count=file_rotations, offset=offset), rotations):
+        return None
+    offset += _padded(8 * file_rotations)
+
+    template_count = count * file_rotations * file_points * 2
+    if offset + 8 * template_count > len(mapped):
+        return None
+    recognizer = GestureRecognizer()
+    recognizer.names = names
+    recognizer.templates = np.frombuffer(mapped, dtype='<f8', count=template_count, offset=offset).reshape(
+        count, file_rotations, file_points, 2)
+    return recognizer
+
+
+# A recognizer over the named gestures of my_gestures, decoded from their strings
+def build(names):
+    import my_gestures
+
+    recognizer = GestureRecognizer()
+    for name in names:
+        recognizer.add_gesture(name, getattr(my_gestures, name))
+    return recognizer
+
+
+# A recognizer over the named gestures: from the precompiled file when it has exactly these, otherwise decoded from
+# my_gestures (and written out so the next startup can use the file)
+def load_recognizer(names, path=store_path):
+    recognizer = load(path)
+    if recognizer is not None and recognizer.names == list(names):
+        return recognizer
+
+    recognizer = build(names)
+    save(recognizer, path)
+    return recognizer
+
+
+# Build step: precompile the gesture templates used by the app, e.g.
+#   python gesture_store.py
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Precompile the gesture templates from my_gestures.')
+    parser.add_argument('names', nargs='*', default=app_gestures)
+    parser.add_argument('--output', default=store_path)
+    args = parser.parse_args()
+
+    if save(build(args.names), args.output):
+        print(f'{len(args.names)} templates: {args.output}')
+    else:
+        print(f'could not write {args.output}')
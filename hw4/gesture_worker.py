@@ -0,0 +1,87 @@
+import queue
+import threading
+import time
+
+from kivy.clock import Clock
+
+
+# Runs gesture scoring on a background thread so touch handling and drawing never wait for it.
+#
+# Jobs (starting a stroke, scoring a partial stroke, recognizing a finished one) go to a single worker thread in the
+# order they are submitted, which also keeps the InFlightRecognizer's running state in step with the strokes. Each
+# result is put on a small result queue and handed back to the main loop through Clock, where the job's callback is
+# called with (result, event_time); event_time is the perf_counter time the job was submitted. Callbacks are always
+# called in submission order, so gesture actions apply in the order the gestures were made.
+#
+# Partial strokes are scored at most one at a time: while one is being scored, newer partial strokes are skipped
+# rather than queued, so the worker never falls behind the finger.
+class GestureWorker:
+    def __init__(self, inflight, minscore=0.85):
+        self.inflight = inflight
+        self.recognizer = inflight.recognizer
+        self.minscore = minscore
+
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._submitted = 0
+        self._delivered = 0
+        self._pending = {}  # sequence number -> result that arrived before an earlier one was delivered
+        self._partial_busy = False
+
+        self._thread = threading.Thread(target=self._run, name='gesture-worker', daemon=True)
+        self._thread.start()
+
+    # A new stroke starts
+    def begin(self):
+        self._submit('begin', None, None)
+
+    # Score the stroke so far; callback gets (name, score, margin) and whether to commit early, or None
+    def score_partial(self, points, callback):
+        if self._partial_busy: return
+        self._partial_busy = True
+        self._submit('partial', points.copy(), callback)
+
+    # Recognize a finished stroke; callback gets (score, name) or None, like GestureRecognizer.find()
+    def recognize(self, points, callback):
+        self._submit('final', points.copy(), callback)
+
+    def stop(self):
+        self._jobs.put(None)
+
+    def _submit(self, kind, points, callback):
+        self._jobs.put((self._submitted, kind, points, callback, time.perf_counter()))
+        self._submitted += 1
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None: return
+            seq, kind, points, callback, event_time = job
+
+            result = None
+            if kind == 'begin':
+                self.inflight.begin()
+            elif kind == 'partial':
+                confidence = self.inflight.update(points)
+                if confidence is not None:
+                    result = confidence, self.inflight.should_commit()
+            else:
+                result = self.recognizer.find(points, self.minscore)
+
+            self._results.put((seq, kind, result, callback, event_time))
+            Clock.schedule_once(self._deliver)
+
+    # Main thread: hand the finished results to their callbacks, in order
+    def _deliver(self, dt):
+        while True:
+            try:
+                item = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending[item[0]] = item
+
+        while self._delivered in self._pending:
+            seq, kind, result, callback, event_time = self._pending.pop(self._delivered)
+            self._delivered += 1
+            if kind == 'partial': self._partial_busy = False
+            if callback is not None: callback(result, event_time)
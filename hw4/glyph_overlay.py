@@ -0,0 +1,79 @@
+from array import array
+
+from kivy.graphics import Color, InstructionGroup, Mesh
+from kivy.graphics.texture import Texture
+
+# Where the two colours sit in the palette texture (centre of each texel)
+red_u = 0.25
+green_u = 0.75
+
+_palette = None
+
+
+# A 2x1 texture with an opaque red and an opaque green texel; the overlay picks its colours from it by tex coords
+def get_overlay_palette():
+    global _palette
+    if _palette is None:
+        _palette = Texture.create(size=(2, 1), colorfmt='rgba')
+        _palette.mag_filter = 'nearest'
+        _palette.min_filter = 'nearest'
+        _palette.blit_buffer(bytes((255, 0, 0, 255, 0, 255, 0, 255)), colorfmt='rgba', bufferfmt='ubyte')
+    return _palette
+
+
+# The debug boxes around the glyphs of a label, drawn as one Mesh.
+#
+# Every glyph is a quad in the same mesh, alternating red and green through the palette texture, so the overlay is
+# always two instructions (a Color for the alpha and the Mesh) however long the word is. The vertex and index
+# arrays are allocated for capacity glyphs, grown by doubling when a longer word comes along, and otherwise only
+# the quad positions are rewritten in place. Tex coords (the colours) and indices only change when the arrays grow.
+class GlyphOverlayMesh:
+    def __init__(self, alpha=0.3, capacity=16):
+        self.group = InstructionGroup()
+        self.group.add(Color(1, 1, 1, alpha))
+        self.mesh = Mesh(mode='triangles', texture=get_overlay_palette())
+        self.group.add(self.mesh)
+
+        self.vertices = array('f')  # x, y, u, v per corner, 4 corners per glyph
+        self.indices = array('H')
+        self.capacity = 0
+        self._grow(capacity)
+
+    # Draw the boxes for glyph_attribs with the baseline starting at (x_offset, y_offset)
+    def update(self, glyph_attribs, x_offset, y_offset):
+        count = len(glyph_attribs)
+        if count > self.capacity:
+            self._grow(max(count, 2 * self.capacity))
+
+        vertices = self.vertices
+        for i, rect in enumerate(glyph_attribs):
+            rect_x, rect_y, rect_w, rect_h, glyph_ascent, glyph_descent, x_advance = rect
+            x0 = x_offset + rect_x
+            y0 = y_offset - glyph_descent
+            x1 = x0 + rect_w
+            y1 = y0 + rect_h
+            j = 16 * i
+            vertices[j], vertices[j + 1] = x0, y0
+            vertices[j + 4], vertices[j + 5] = x1, y0
+            vertices[j + 8], vertices[j + 9] = x1, y1
+            vertices[j + 12], vertices[j + 13] = x0, y1
+
+        self.mesh.vertices = memoryview(vertices)[:16 * count]
+        self.mesh.indices = memoryview(self.indices)[:6 * count]
+
+    def clear(self):
+        self.update((), 0, 0)
+
+    # The mesh holds memoryviews of the current arrays, which cannot be resized while those exist, so the grown
+    # arrays are new copies that replace them
+    def _grow(self, capacity):
+        vertices = array('f', self.vertices)
+        indices = array('H', self.indices)
+        for i in range(self.capacity, capacity):
+            u = red_u if i % 2 == 0 else green_u  # Alternate colors
+            vertices.extend((0, 0, u, 0.5) * 4)
+            n = 4 * i
+            indices.extend((n, n + 1, n + 2, n, n + 2, n + 3))
+        self.vertices = vertices
+        self.indices = indices
+        self.capacity = capacity
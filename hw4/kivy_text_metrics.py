@@ -1,29 +1,451 @@
+import io
+import os
+import re
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+
 import freetype
 import uharfbuzz as hb
 
+from font_metrics_store import FontMetricsStore
+
+
+# Glyph attributes for a shaped string, stored column-wise in arrays rather than as a list of 7-tuples.
+#
+# The columns are: rect_x, rect_y, rect_w, rect_h, glyph_ascent, glyph_descent, x_advance.
+# The horizontal columns (rect_x, rect_w and x_advance) carry a shared scale factor sx, so scaling a whole string to
+# the texture width is one multiply on the factor and the columns themselves are never copied. Scaled views share
+# their columns with the unscaled attribs they were made from.
+#
+# For compatibility, indexing and iterating still give the old tuples, so existing code such as
+# glyph_attribs[i][6] or "for rect in glyph_attribs" keeps working.
+#
+# clusters holds harfbuzz's cluster value for each glyph, which is the index of the first character of the shaped
+# string that the glyph was made from, and glyph_ids holds the font's glyph id. Both are empty for attribs built from
+# plain tuples.
+class GlyphAttribs:
+    columns = ('rect_x', 'rect_y', 'rect_w', 'rect_h', 'glyph_ascent', 'glyph_descent', 'x_advance')
+    scaled_columns = ('rect_x', 'rect_w', 'x_advance')
+
+    def __init__(self, sx=1.0, source=None):
+        self.sx = sx
+        if source is None:
+            for name in self.columns:
+                setattr(self, name, array('d'))
+            self.clusters = array('L')
+            self.glyph_ids = array('L')
+        else:
+            for name in self.columns:
+                setattr(self, name, getattr(source, name))
+            self.clusters = source.clusters
+            self.glyph_ids = source.glyph_ids
+
+    @classmethod
+    def from_tuples(cls, attribs):
+        glyph_attribs = cls()
+        for attrib in attribs:
+            glyph_attribs.append(*attrib)
+        return glyph_attribs
+
+    def append(self, rect_x, rect_y, rect_w, rect_h, glyph_ascent, glyph_descent, x_advance):
+        self.rect_x.append(rect_x)
+        self.rect_y.append(rect_y)
+        self.rect_w.append(rect_w)
+        self.rect_h.append(rect_h)
+        self.glyph_ascent.append(glyph_ascent)
+        self.glyph_descent.append(glyph_descent)
+        self.x_advance.append(x_advance)
+
+    # A view of the same glyphs with the horizontal columns multiplied by sx
+    def scaled(self, sx):
+        return GlyphAttribs(self.sx * sx, self)
+
+    # The named column with the scale factor applied, as a new array
+    def column(self, name):
+        values = getattr(self, name)
+        if name not in self.scaled_columns or self.sx == 1.0:
+            return array('d', values)
+        return array('d', map(self.sx.__mul__, values))
+
+    # Index of the glyph that draws the character at char_idx of the shaped string.
+    # Characters merged into a ligature map to the ligature glyph.
+    def glyph_for_char(self, char_idx):
+        if not self.clusters:
+            return char_idx
+        return max(bisect_right(self.clusters, char_idx) - 1, 0)
+
+    def __len__(self):
+        return len(self.x_advance)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+
+        sx = self.sx
+        return (self.rect_x[i] * sx, self.rect_y[i], self.rect_w[i] * sx, self.rect_h[i],
+                self.glyph_ascent[i], self.glyph_descent[i], self.x_advance[i] * sx)
+
+    def __iter__(self):
+        sx = self.sx
+        return zip(map(sx.__mul__, self.rect_x), self.rect_y, map(sx.__mul__, self.rect_w), self.rect_h,
+                   self.glyph_ascent, self.glyph_descent, map(sx.__mul__, self.x_advance))
+
 
 # Scales text attributes according to the proportional difference between computed text_width and actual texture_width
+# Text without any width (e.g. empty) gets a scale of 0.
 def scale_attribs(attribs, text_width, texture_width):
-    new_attribs = []
-    sx = texture_width / text_width
+    sx = texture_width / text_width if text_width else 0.0
     # print(f"text_width: {text_width} texture_width: {texture_width} sx: {sx}")
 
-    for attrib in attribs:
-        rect_x, rect_y, rect_w, rect_h, glyph_ascent, glyph_descent, x_advance = attrib
-        new_attrib = rect_x * sx, rect_y, rect_w * sx, rect_h, glyph_ascent, glyph_descent, x_advance * sx
-        new_attribs.append(new_attrib)
+    if not isinstance(attribs, GlyphAttribs):
+        attribs = GlyphAttribs.from_tuples(attribs)
+    return attribs.scaled(sx)
+
+
+# Kivy label markup tags and the escapes for the characters used by them
+markup_tag = re.compile(r'\[/?(?:b|i|u|s|font|font_context|font_family|font_features|size|color|ref|anchor|sub|sup|'
+                        r'text_language)(?:=[^\]]*)?\]')
+markup_entities = (('&bl;', '['), ('&br;', ']'), ('&amp;', '&'))
+
+
+# Removes Kivy markup from text, leaving only the characters that are actually drawn
+def strip_markup(text):
+    text = markup_tag.sub('', text)
+    for entity, char in markup_entities:
+        text = text.replace(entity, char)
+    return text
+
+
+# A small least-recently-used mapping with hit/miss counters.
+class LRUCache:
+    # on_evict, if given, is called with (key, value) for every entry pushed out of the cache
+    def __init__(self, maxsize, on_evict=None):
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    # Return the cached value for key (marking it as most recently used), or None on a miss.
+    def get(self, key):
+        value = self._items.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    # Store value under key, evicting the least recently used entries once maxsize is exceeded.
+    def put(self, key, value):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            evicted = self._items.popitem(last=False)
+            if self.on_evict is not None:
+                self.on_evict(*evicted)
+
+    def values(self):
+        return list(self._items.values())
+
+    def clear(self):
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {'size': len(self._items), 'maxsize': self.maxsize,
+                'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hit_rate()}
+
+
+# Per-glyph freetype metrics for one face at one size, stored as compact arrays indexed by glyph id.
+# Rows are filled lazily on first use (or all at once with fill_cmap), so each glyph is loaded from freetype
+# at most once per (font, size) instead of once per occurrence in the text.
+#
+# The columns are either fresh arrays or memoryviews over a FontMetricsStore file; both index the same way.
+class GlyphTable:
+    # column name and array typecode, in the order they are stored on disk
+    layout = (('loaded', 'B'),
+              ('x_offset', 'f'),  # horiBearingX
+              ('y_offset', 'f'),  # horiBearingY, also the glyph ascent
+              ('glyph_descent', 'f'),  # height - horiBearingY
+              ('h_advance', 'f'),  # freetype's unkerned horiAdvance
+              ('bitmap_width', 'H'),
+              ('bitmap_rows', 'H'))
+
+    def __init__(self, font, num_glyphs, columns=None):
+        self.font = font
+        self.num_glyphs = num_glyphs
+        for name, typecode in self.layout:
+            if columns is None:
+                column = array(typecode, bytes(array(typecode).itemsize * num_glyphs))
+            else:
+                column = columns[name]
+            setattr(self, name, column)
+
+        # How many lookups were made, and how many of them actually had to load the glyph from freetype
+        self.lookups = 0
+        self.glyph_loads = 0
+
+    # Make sure the row for gid is filled in. Returns gid so it can be used inline.
+    def ensure(self, gid):
+        self.lookups += 1
+        if not self.loaded[gid]:
+            self._load(gid)
+        return gid
+
+    # Fill in every glyph reachable from the font's character map up front.
+    def fill_cmap(self):
+        face = self.font.face
+        charcode, gid = face.get_first_char()
+        while gid:
+            if not self.loaded[gid]:
+                self._load(gid)
+            charcode, gid = face.get_next_char(charcode, gid)
+
+    def _load(self, gid):
+        # We use freetype to lookup information about each glyph
+        face = self.font.face
+        face.load_glyph(gid)
+        glyph = face.glyph
+        metrics = glyph.metrics
+
+        # Some freetype glyph metrics
+        self.x_offset[gid] = metrics.horiBearingX / 64
+        self.y_offset[gid] = metrics.horiBearingY / 64
+        self.glyph_descent[gid] = (metrics.height - metrics.horiBearingY) / 64
+        self.h_advance[gid] = metrics.horiAdvance / 64
+        self.bitmap_width[gid] = glyph.bitmap.width  # This probably works as well: metrics.width / 64.0
+        self.bitmap_rows[gid] = glyph.bitmap.rows  # This probably works as well: metrics.height / 64.0
+
+        self.loaded[gid] = 1
+        self.glyph_loads += 1
+
+    def columns(self):
+        return {name: getattr(self, name) for name, typecode in self.layout}
+
+    def stats(self):
+        return {'lookups': self.lookups, 'glyph_loads': self.glyph_loads,
+                'glyph_loads_saved': self.lookups - self.glyph_loads}
+
+
+# A font file, read and handed to harfbuzz at most once and only when something actually needs it.
+class FontFile:
+    def __init__(self, font_path):
+        self.font_path = font_path
+        self._data = None
+        self._hb_face = None
+
+    @property
+    def data(self):
+        if self._data is None:
+            with open(self.font_path, 'rb') as f:
+                self._data = f.read()
+        return self._data
+
+    # The harfbuzz face is shared by every size of the same font, only the scale differs
+    @property
+    def hb_face(self):
+        if self._hb_face is None:
+            self._hb_blob = hb.Blob(self.data)
+            self._hb_face = hb.Face(self._hb_blob)
+        return self._hb_face
+
+
+# A freetype face and harfbuzz font for one (font_path, font_size) pair, plus the metrics derived from them.
+#
+# When the metrics come from a FontMetricsStore, the face and font are only created once a glyph is missing from
+# the table or a word has to be shaped, so opening a cached font does no freetype or harfbuzz parsing at all.
+class FontEntry:
+    def __init__(self, font_path, font_size, font_file, store=None):
+        self.font_path = font_path
+        self.font_size = font_size
+        self.font_file = font_file
+        self._face = None
+        self._hb_font = None
+        self._hb_buffer = None
+
+        cached = store.load(font_path, font_size) if store is not None else None
+        if cached is not None:
+            self.ascender = cached.ascender
+            self.descender = cached.descender
+            self.glyphs = GlyphTable(self, cached.num_glyphs, cached.columns)
+        else:
+            # Extract needed face.size.* values from freetype
+            self.ascender = self.face.size.ascender / 64.0
+            self.descender = self.face.size.descender / 64.0
+            self.glyphs = GlyphTable(self, self.face.num_glyphs)
 
-    return new_attribs
+    # Configure freetype from the already-read font file, so the file is not opened again
+    @property
+    def face(self):
+        if self._face is None:
+            self._face = freetype.Face(io.BytesIO(self.font_file.data))
+            self._face.set_char_size(self.font_size * 64)
+        return self._face
+
+    @property
+    def hb_face(self):
+        return self.font_file.hb_face
+
+    @property
+    def hb_font(self):
+        if self._hb_font is None:
+            self._hb_font = hb.Font(self.font_file.hb_face)
+            self._hb_font.scale = (self.font_size * 64, self.font_size * 64)
+        return self._hb_font
+
+    # Reused for every word shaped with this font instead of allocating a new buffer each time
+    @property
+    def hb_buffer(self):
+        if self._hb_buffer is None:
+            self._hb_buffer = hb.Buffer()
+        return self._hb_buffer
+
+
+# Process-wide cache of FontEntry objects keyed by (font_path, font_size).
+# Each font file is read and handed to harfbuzz once per session; each size gets its own freetype face.
+# It also holds the shaping results for those fonts, keyed by (font_path, font_size, text, features).
+#
+# With a FontMetricsStore, glyph tables are loaded from disk when a font is first used and written back by
+# save_metrics() once new glyphs have been measured. A read_only cache loads them but never writes them.
+class FontCache:
+    def __init__(self, maxsize=16, shape_maxsize=4096, store=None, read_only=False):
+        self.entries = LRUCache(maxsize, on_evict=self._evicted)
+        self.shapes = LRUCache(shape_maxsize)
+        self.store = store
+        self.read_only = read_only
+        self._files = {}  # font_path -> FontFile
+
+    def get(self, font_path, font_size):
+        key = (font_path, font_size)
+        entry = self.entries.get(key)
+        if entry is None:
+            font_file = self._files.get(font_path)
+            if font_file is None:
+                font_file = self._files[font_path] = FontFile(font_path)
+            entry = FontEntry(font_path, font_size, font_file, self.store)
+            self.entries.put(key, entry)
+        return entry
+
+    # Measure every glyph in the font's character map and write the table to the store.
+    def precompile(self, font_path, font_size):
+        entry = self.get(font_path, font_size)
+        entry.glyphs.fill_cmap()
+        self._save(entry)
+
+    # Write every glyph table that has measured new glyphs since it was loaded.
+    def save_metrics(self):
+        for entry in self.entries.values():
+            if entry.glyphs.glyph_loads:
+                self._save(entry)
+
+    # A font dropped out of the cache: keep the glyphs it measured, as save_metrics() will no longer see it.
+    def _evicted(self, key, entry):
+        if entry.glyphs.glyph_loads:
+            self._save(entry)
+
+    def _save(self, entry):
+        if self.store is None or self.read_only: return False
+        glyphs = entry.glyphs
+        return self.store.save(entry.font_path, entry.font_size, entry.ascender, entry.descender,
+                               glyphs.num_glyphs, glyphs.columns())
+
+    def clear(self):
+        self.entries.clear()
+        self.shapes.clear()
+        self._files.clear()
+
+    def stats(self):
+        return {'fonts': self.entries.stats(), 'shapes': self.shapes.stats()}
+
+
+# Shared by every TextMetrics unless another cache is passed in
+metrics_cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'metrics_cache')
+font_cache = FontCache(store=FontMetricsStore(metrics_cache_dir, GlyphTable.layout))
+
+# In my testing, it does appear that Kivy/SDL2 has both kerning and ligatures enabled.
+# So let's make sure the measurements are based on those options enabled.
+default_features = {
+    'kern': True,  # Kerning
+    'liga': True,  # Standard Ligatures
+}
+
+
+# Shaping results for a whole tokenized document, stored as flat arrays instead of one list per word.
+#
+# The glyphs of word i are glyphs word_start[i] to word_start[i + 1] - 1. For each glyph we keep its (unscaled)
+# harfbuzz x_advance and the running sum of advances within its word, so the advance up to any glyph of any word
+# is a single lookup. Like get_text_extents, the *_scaled helpers correct the harfbuzz advances to the width of the
+# texture Kivy/SDL2 actually generated for the word.
+class ShapedDocument:
+    def __init__(self, font_path, font_size, ascender, descender):
+        self.font_path = font_path
+        self.font_size = font_size
+        self.ascender = ascender
+        self.descender = descender
+
+        self.word_start = array('L', [0])
+        self.x_advance = array('d')
+        self.clusters = array('L')
+        self.advance_sum = array('d')  # inclusive running sum of x_advance within each word
+        self.word_width = array('d')
+
+    def __len__(self):
+        return len(self.word_width)
+
+    def add_word(self, glyph_attribs, text_width):
+        x_advance = glyph_attribs.column('x_advance')
+        self.x_advance.extend(x_advance)
+        self.advance_sum.extend(accumulate(x_advance))
+        self.clusters.extend(glyph_attribs.clusters)
+
+        self.word_start.append(len(self.x_advance))
+        self.word_width.append(text_width)
+
+    def glyph_count(self, word_idx):
+        return self.word_start[word_idx + 1] - self.word_start[word_idx]
+
+    # Index (within the word) of the glyph that draws character char_idx of the word
+    def glyph_for_char(self, word_idx, char_idx):
+        start = self.word_start[word_idx]
+        end = self.word_start[word_idx + 1]
+        if len(self.clusters) < end:
+            return char_idx
+        return max(bisect_right(self.clusters, char_idx, start, end) - 1 - start, 0)
+
+    # Sum of the advances of glyphs 0..glyph_idx (inclusive) of the word, scaled to texture_width
+    def advance_to_scaled(self, word_idx, glyph_idx, texture_width):
+        return self.advance_sum[self.word_start[word_idx] + glyph_idx] * self._scale(word_idx, texture_width)
+
+    # Advance of a single glyph of the word, scaled to texture_width
+    def glyph_advance_scaled(self, word_idx, glyph_idx, texture_width):
+        return self.x_advance[self.word_start[word_idx] + glyph_idx] * self._scale(word_idx, texture_width)
+
+    def _scale(self, word_idx, texture_width):
+        text_width = self.word_width[word_idx]
+        return texture_width / text_width if text_width else 0.0
 
 
 class TextMetrics:
-    def __init__(self, font_path, font_size):
+    def __init__(self, font_path, font_size, cache=None):
         self.font_path = ""
         self.font_size = 0
-        self.face = None
-        self.hb_blob = None
-        self.hb_face = None
-        self.hb_font = None
+        self.cache = font_cache if cache is None else cache
+        self.font = None
         self.set_font(font_path, font_size)
 
     # Configure the font that will be measured.
@@ -31,61 +453,104 @@ class TextMetrics:
         self.font_path = font_path
         self.font_size = font_size
 
-        # Configure freetype
-        self.face = freetype.Face(self.font_path)
-        self.face.set_char_size(self.font_size * 64)
+        # Faces and fonts come ready-configured from the cache
+        self.font = self.cache.get(font_path, font_size)
 
-        # Load the font face buffer for HarfBuzz
-        self.hb_blob = hb.Blob.from_file_path(font_path)
-        self.hb_face = hb.Face(self.hb_blob)
-        self.hb_font = hb.Font(self.hb_face)
-        self.hb_font.scale = (self.font_size * 64, self.font_size * 64)
+    @property
+    def face(self):
+        return self.font.face
+
+    @property
+    def hb_face(self):
+        return self.font.hb_face
+
+    @property
+    def hb_font(self):
+        return self.font.hb_font
 
     # Find the extents of the text for the specified font and size.
     #
     # Parameters:
     # text: The string to be measured
     # output_texture_size: The size of the texture that Kivy/SDL2 has already generated (e.g. for a Label)
+    # features: Optional harfbuzz feature dict, defaults to default_features
     #
     # Return: A tuple of: glyph_attribs, ascender, descender
-    # glyph_attribs is a list of tuples of: rect_x, rect_y, rect_w, rect_h, glyph_ascent, glyph_descent, x_advance
+    # glyph_attribs is a GlyphAttribs, which indexes like a list of tuples of:
+    # rect_x, rect_y, rect_w, rect_h, glyph_ascent, glyph_descent, x_advance
     # Those attribs specify bounding box of the glyph, ascent and descent (relative to baseline), and advance to the
     # next glyph.
     # The ascender, and descender specify the full ascent/descent for the font and can be used to determine the
     # baseline.
-    def get_text_extents(self, text, output_texture_size):
-        # Extract needed face.size.* values from freetype
-        ascender = self.face.size.ascender / 64.0
-        descender = self.face.size.descender / 64.0
+    def get_text_extents(self, text, output_texture_size, features=None):
+        hb_glyph_attribs, hb_x_cursor = self.shape(text, features)
+
+        # harfbuzz's horizontal advances do not generally sum to Kivy/SDL2's texture width
+        # So let's just proportionally scale the advances to the correct width.
+        # Everything appears to align once this method is applied.
+        hb_glyph_attribs = scale_attribs(hb_glyph_attribs, hb_x_cursor, output_texture_size[0])
+        return hb_glyph_attribs, self.font.ascender, self.font.descender
+
+    # Same as get_text_extents, but for text containing Kivy markup.
+    # Only the visible characters are shaped, so the markup tags cost nothing and do not show up as glyphs.
+    #
+    # Return: A tuple of: glyph_attribs, ascender, descender, plain_text
+    # glyph_attribs.glyph_for_char() maps an index into plain_text to the glyph drawing that character.
+    def get_markup_extents(self, text, output_texture_size, features=None):
+        plain_text = strip_markup(text)
+        glyph_attribs, ascender, descender = self.get_text_extents(plain_text, output_texture_size, features)
+        return glyph_attribs, ascender, descender, plain_text
 
+    # Shape every word of a tokenized document in one pass.
+    # Repeated words are only shaped once thanks to the shaping cache.
+    #
+    # Return: A ShapedDocument with one entry per word
+    def get_text_extents_many(self, words, features=None):
+        doc = ShapedDocument(self.font_path, self.font_size, self.font.ascender, self.font.descender)
+        shape = self.shape
+        add_word = doc.add_word
+        for word in words:
+            add_word(*shape(word, features))
+        return doc
+
+    # Shape the text and build the unscaled glyph attribs, going through the shaping cache first.
+    # Common words are shaped once per (font, size, features) and then served from the cache.
+    #
+    # Return: A tuple of: unscaled GlyphAttribs, total harfbuzz advance width
+    def shape(self, text, features=None):
+        if features is None: features = default_features
+        key = (self.font_path, self.font_size, text, tuple(sorted(features.items())))
+
+        shapes = self.cache.shapes
+        shaped = shapes.get(key)
+        if shaped is None:
+            shaped = self._shape(text, features)
+            shapes.put(key, shaped)
+        return shaped
+
+    def _shape(self, text, features):
         # Set up harfbuzz for typesetting
-        hb_buffer = hb.Buffer()
+        hb_buffer = self.font.hb_buffer
+        hb_buffer.clear_contents()
         hb_buffer.add_str(text)
         hb_buffer.guess_segment_properties()
 
-        # In my testing, it does appear that Kivy/SDL2 has both kerning and ligatures enabled.
-        # So let's make sure the measurements are based on those options enabled.
-        enable_kerning = True
-        enable_ligatures = True
-
-        features = {
-            'kern': enable_kerning,  # Kerning
-            'liga': enable_ligatures,  # Standard Ligatures
-        }
-
         # The actual harfbuzz typesetting
         hb.shape(self.hb_font, hb_buffer, features)
 
         glyph_info = hb_buffer.glyph_infos
         glyph_positions = hb_buffer.glyph_positions
 
-        hb_glyph_attribs = []
+        glyphs = self.font.glyphs
+        hb_glyph_attribs = GlyphAttribs()
         hb_x_cursor = 0
 
         # Iterate through harfbuzz's typesetting output so we can build each glyph's bounding box
         for info, pos in zip(glyph_info, glyph_positions):
 
             gid = info.codepoint
+            hb_glyph_attribs.clusters.append(info.cluster)
+            hb_glyph_attribs.glyph_ids.append(gid)
 
             # Useful for debugging. Glyph may be a compound ligature of multiple adjacent character in original string
             # glyph_name = self.hb_font.glyph_to_string(gid)
@@ -100,34 +565,27 @@ class TextMetrics:
             # print("Glyph Name:", glyph_name)
             # print(f"hb_x_offset: {hb_x_offset}, hb_y_offset: {hb_y_offset}, x_advance: {hb_x_advance}")
 
-            # We use freetype to lookup information about each glyph
-            self.face.load_glyph(gid)
-            bitmap = self.face.glyph.bitmap
-
-            # Some freetype glyph metrics
-            glyph_ascent = self.face.glyph.metrics.horiBearingY / 64
-            glyph_descent = (self.face.glyph.metrics.height - self.face.glyph.metrics.horiBearingY) / 64
-            x_offset = self.face.glyph.metrics.horiBearingX / 64
-            y_offset = self.face.glyph.metrics.horiBearingY / 64
+            # We use the cached freetype metrics for each glyph
+            glyphs.ensure(gid)
+            glyph_ascent = glyphs.y_offset[gid]
+            glyph_descent = glyphs.glyph_descent[gid]
+            rect_rows = glyphs.bitmap_rows[gid]
 
             # Harfbuzz's hb_x_offset and hb_y_offset are always zero for some reason.
             # So we'll use the base freetype offsets, which seem to work.
-            hb_rect_x = hb_x_cursor + x_offset
-            hb_rect_y = y_offset - bitmap.rows
-            hb_rect_w = bitmap.width  # This probably works as well: self.face.glyph.metrics.width / 64.0
-            hb_rect_h = bitmap.rows  # This probably works as well: self.face.glyph.metrics.height / 64.0
+            hb_rect_x = hb_x_cursor + glyphs.x_offset[gid]
+            hb_rect_y = glyph_ascent - rect_rows
+            hb_rect_w = glyphs.bitmap_width[gid]
+            hb_rect_h = rect_rows
 
             # Save the info for the current glyph
-            hb_glyph_attribs.append((hb_rect_x, hb_rect_y, hb_rect_w, hb_rect_h,
-                                    glyph_ascent, glyph_descent, hb_x_advance))
+            hb_glyph_attribs.append(hb_rect_x, hb_rect_y, hb_rect_w, hb_rect_h,
+                                    glyph_ascent, glyph_descent, hb_x_advance)
 
             # Advance to the next glyph position
             hb_x_cursor += hb_x_advance
 
         # print(f"total width via harfbuzz: {hb_x_cursor}")
 
-        # harfbuzz's horizontal advances do not generally sum to Kivy/SDL2's texture width
-        # So let's just proportionally scale the advances to the correct width.
-        # Everything appears to align once this method is applied.
-        hb_glyph_attribs = scale_attribs(hb_glyph_attribs, hb_x_cursor, output_texture_size[0])
-        return hb_glyph_attribs, ascender, descender
+        # The cached attribs are never modified, scale_attribs only makes scaled views of them
+        return hb_glyph_attribs, hb_x_cursor
@@ -1,7 +1,16 @@
-import math, os
+import math, os, time
 from pathlib import Path
 from helper_functions import config_kivy
-from kivy_text_metrics import TextMetrics
+from kivy_text_metrics import TextMetrics, font_cache
+from glyph_atlas import AtlasWordRenderer
+from lookahead_shaper import LookaheadShaper
+from document_sources import open_document
+from async_file_chooser import AsyncFileChooser
+from playback_timeline import PlaybackTimeline
+from rsvp_scheduler import RSVPScheduler
+from playback_telemetry import PlaybackTelemetry
+from word_texture_queue import WordTextureQueue
+from glyph_overlay import GlyphOverlayMesh
 from kivy.app import App
 from kivy.config import Config
 from kivy.uix.widget import Widget
@@ -16,10 +25,13 @@ from kivy.factory import Factory
 from kivy.uix.label import Label
 from kivy.clock import Clock
 from kivy.uix.spinner import Spinner
-from kivy.graphics import Color, Line, Rectangle, Ellipse, InstructionGroup
+from kivy.graphics import Color, Line, InstructionGroup
 from kivy.uix.relativelayout import RelativeLayout
-from kivy.gesture import Gesture, GestureDatabase
-from my_gestures import up_arrow, down_arrow, right_arrow, left_arrow, line, cross, circle
+from kivy.properties import NumericProperty
+from gesture_store import app_gestures, load_recognizer
+from gesture_recognizer import InFlightRecognizer
+from gesture_worker import GestureWorker
+from stroke_buffer import StrokeBuffer, StrokeTrail
 
 # fonts
 fonts = {
@@ -33,13 +45,22 @@ fonts = {
 	'GaramondPro': {"regular": "./Fonts/AGaramondPro-Regular.otf"},  # 7
 }
 
-# gestures
-def simple_gesture(name, point_list):
-	g = Gesture()
-	g.add_stroke(point_list)
-	g.normalize()
-	g.name = name
-	return g
+# draw words from a shared glyph atlas instead of rendering a label texture for every word
+use_glyph_atlas = False
+
+# how many upcoming words are kept shaped in the background during playback
+lookahead_window = 64
+
+# how many upcoming word textures are rendered ahead of time during playback
+prerender_depth = 8
+
+# draw the red/green glyph boxes over the word label (debug overlay); False skips all overlay work
+show_glyph_overlay = True
+
+# record per-word playback timings; written to telemetry_path on exit and on the t key, which also print the
+# gesture-to-action latencies whether this is on or not
+telemetry_enabled = False
+telemetry_path = 'playback_telemetry.csv'
 
 # density pixel thing
 do_simulate = False
@@ -47,44 +68,101 @@ scr_w, scr_h = config_kivy(window_width = 1200, window_height = 600,
 												simulate_device = do_simulate, simulate_dpi = 100,
 												simulate_density = 1.0)
 
+# index of the focus letter of a word, and the word with that letter marked up
+def focus_markup(word):
+	marked_letter_idx = 0
+	if len(word) > 6: marked_letter_idx = math.floor(len(word) // 3)
+	elif len(word) > 2: marked_letter_idx = math.floor(len(word) // 2)
+
+	letters_before = word[:marked_letter_idx]
+	marked_letter = word[marked_letter_idx]
+	letters_after = word[(marked_letter_idx + 1):]
+
+	return marked_letter_idx, f'{letters_before}[color=ff7f7f]{marked_letter}[/color]{letters_after}'
+
 # text sizing
 class ShrinkWrapLabel(Label):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.bind(size=self.update_glyph_overlay,
-                  pos=self.update_glyph_overlay,
-                  texture=self.update_glyph_overlay,
-                  font_size=self.update_glyph_overlay)
-
         self.kv_posted = False
+        self.prerendered = None
+
+        # debug overlay state: the shaping of the current text, redone only when the text or font changed
+        self.overlay_metrics = None
+        self.overlay_shape = None
+        self.overlay_shape_dirty = True
+
+        # in production mode none of the overlay bindings exist, so nothing is ever shaped or drawn for it
+        if not show_glyph_overlay: return
+
+        # a word change fires several of these; they all end up in a single overlay update per frame
+        self.overlay_trigger = Clock.create_trigger(self.update_glyph_overlay, -1)
+        self.glyph_overlay = GlyphOverlayMesh()
+        self.canvas.after.add(self.glyph_overlay.group)
+        self.bind(size=self.move_glyph_overlay,
+                  pos=self.move_glyph_overlay,
+                  texture=self.reshape_glyph_overlay,
+                  font_name=self.reshape_glyph_overlay,
+                  font_size=self.reshape_glyph_overlay)
 
     def on_kv_post(self, base_widget):
         self.kv_posted = True
 
+    # shows text with a texture rendered ahead of time, skipping the usual render on the next frame
+    def show_prerendered(self, text, texture):
+        self.prerendered = (text, self.font_name, self.font_size, texture)
+        self.text = text
+        self.texture = texture
+        self.texture_size = list(texture.size)
+
+    def texture_update(self, *largs):
+        if self.prerendered is not None and self.prerendered[:3] == (self.text, self.font_name, self.font_size):
+            self.texture = self.prerendered[3]
+            self.texture_size = list(self.texture.size)
+            return
+        self.prerendered = None
+        super().texture_update(*largs)
+
+    # the label moved or was resized: the boxes only need redrawing
+    def move_glyph_overlay(self, *args):
+        self.overlay_trigger()
+
+    # new texture or font size: the text needs shaping again
+    def reshape_glyph_overlay(self, *args):
+        self.overlay_shape_dirty = True
+        self.overlay_trigger()
+
     def update_glyph_overlay(self, *args):
         if not self.kv_posted: return
         if self.texture is None: return
 
-        colors = [(1, 0, 0, 0.3), (0, 1, 0, 0.3)]  # Alternate between red and green
-
         # print(f"font_name: {self.font_name} font_size: {self.font_size}")
 
-        metrics = TextMetrics(self.font_name, self.font_size)
-
-        glyph_attribs, ascender, descender = metrics.get_text_extents(self.text, self.texture.size)
+        if self.overlay_shape_dirty or self.overlay_shape is None:
+            if self.overlay_metrics is None:
+                self.overlay_metrics = TextMetrics(self.font_name, self.font_size)
+            elif (self.overlay_metrics.font_path, self.overlay_metrics.font_size) != (self.font_name, self.font_size):
+                self.overlay_metrics.set_font(self.font_name, self.font_size)
+            metrics = self.overlay_metrics
+
+            if self.markup:
+                self.overlay_shape = metrics.get_markup_extents(self.text, self.texture.size)[:3]
+            else:
+                self.overlay_shape = metrics.get_text_extents(self.text, self.texture.size)
+            self.overlay_shape_dirty = False
+        glyph_attribs, ascender, descender = self.overlay_shape
+        if glyph_attribs.sx == 0:
+            # nothing to draw (e.g. the text was just cleared), and no width to place the glyphs by
+            self.glyph_overlay.clear()
+            return
 
         # Calculate the label's starting position for text drawing
         # This should define the baseline
         x_offset = self.center_x - (self.texture.width / 2)
         y_offset = self.center_y + (self.texture.height / 2) - ascender
 
-        self.canvas.after.clear()
-        with self.canvas.after:
-            # draw the boxes around the glyphs of the string
-            for i, rect in enumerate(glyph_attribs):
-                rect_x, rect_y, rect_w, rect_h, glyph_ascent, glyph_descent, x_advance = rect
-                Color(*colors[i % 2])  # Alternate colors
-                Rectangle(pos=(x_offset + rect_x, y_offset - glyph_descent), size=(rect_w, rect_h))
+        # draw the boxes around the glyphs of the string
+        self.glyph_overlay.update(glyph_attribs, x_offset, y_offset)
 
 # custom classes for this assignment
 class PopupFile(Popup):
@@ -99,10 +177,8 @@ class PopupFile(Popup):
 		self.main_app.curr_idx = 0
 		self.main_app.word_label.text = ''
 		try:
-			with open(filename[0]) as f:
-				contents = f.read()
-				# print(contents)
-				self.main_app.load_wordlst(contents)
+			# only the start of the file is indexed (or decoded) here, the rest is indexed in the background
+			self.main_app.load_wordlst(open_document(filename[0]))
 			self.dismiss()
 			self.main_app.ids['pause'].disabled = False
 			self.main_app.create_dropdown()
@@ -116,9 +192,12 @@ class PauseButton(Button):
 class MainScreen(Screen):
 	curr_word = ''
 	wordlst = []
+	lookahead = None
+	texture_queue = None
+	scheduler = None
 	curr_idx = 0
 	is_running = False
-	wpm = 150
+	wpm = NumericProperty(150)
 	curr_font_size = 24
 	curr_font_type = 'Helvetica'
 	is_in_bounds = True
@@ -133,6 +212,11 @@ class MainScreen(Screen):
 		self.dropdown = DropDown()
 		self.create_dropdown()
 
+		# word timings and playback for the loaded document
+		self.telemetry = PlaybackTelemetry(enabled = telemetry_enabled)
+		self.texture_ready_trigger = Clock.create_trigger(self.telemetry.mark_texture_ready)
+		self.reset_playback()
+
 		# word label instantiation
 		self.pos_label = RelativeLayout(size = self.size, size_hint = (None, None))
 
@@ -146,8 +230,14 @@ class MainScreen(Screen):
 		self.pos_label.add_widget(self.word_label)
 		self.add_widget(self.pos_label)
 
+		if use_glyph_atlas:
+			self.atlas_word = AtlasWordRenderer(self.word_label.font_name, self.word_label.font_size,
+									   size_hint = (None, None))
+			self.add_widget(self.atlas_word)
+
 		# print(self.word_label.font_name)
 		# print(os.path.exists(self.word_label.font_name))
+		self.create_baseline_focus_lines()
 		self.draw_baseline_focus_lines()
 		self.word_label.text = ''
 
@@ -156,63 +246,52 @@ class MainScreen(Screen):
 		self._keyboard.bind(on_key_down = self._on_keyboard_down)
 
 		# gesture instantiation
-		self.gdb = GestureDatabase()
-		self.gdb.add_gesture(right_arrow)
-		self.gdb.add_gesture(left_arrow)
-		self.gdb.add_gesture(up_arrow)
-		self.gdb.add_gesture(down_arrow)
-		self.gdb.add_gesture(cross) # increase font size
-		self.gdb.add_gesture(line) # decrease font size
-		self.gdb.add_gesture(circle) # pause/play
+		# precompiled templates, decoded from my_gestures only when gesture_templates.bin is missing or stale
+		self.recognizer = load_recognizer(app_gestures)
+		# scores strokes while they are drawn; a closed circle can act before the finger is lifted
+		self.inflight = InFlightRecognizer(self.recognizer, early_commit = ('circle',))
+		# all scoring happens on this worker; results come back through the Clock in order
+		self.gesture_worker = GestureWorker(self.inflight, minscore = 0.85)
 
 		self.x_min, self.x_max = 20 * Metrics.dp, 1180 * Metrics.dp
 		self.y_min, self.y_max = 130 * Metrics.dp, 490 * Metrics.dp
 
-		self.gesture_instrct = None
+		self.gesture_trail = None
 
 	# canvas drawing
-	def draw_baseline_focus_lines(self):
-		self.word_label.texture_update()
-		if self.word_label.texture is None: return False
-		metrics = TextMetrics(self.word_label.font_name, self.word_label.font_size)
-		glyph_attribs, ascender, descender = metrics.get_text_extents(self.word_label.text,
-																self.word_label.texture.size)
-		
+	# the guide lines are made once here and only moved afterwards
+	def create_baseline_focus_lines(self):
 		self.line_group = InstructionGroup()
+		self.line_group.add(Color(1, 1, 1, 1))
 
-		Color(1, 1, 1, 1)
+		self.baseline_lines = [Line(points = [0, 0, 0, 0], width = 1.2) for _ in range(2)]  # bottom, top
+		self.focus_lines = [Line(points = [0, 0, 0, 0], width = 1) for _ in range(2)]  # bottom, top
+		for line in self.baseline_lines + self.focus_lines: self.line_group.add(line)
+		self.canvas.add(self.line_group)
 
-		x_ofst = 600 * Metrics.dp
-		y_ofst = 300 * Metrics.dp + (self.word_label.texture.height / 2) - ascender
+		# window resizes only move the lines
+		self.guide_lines_trigger = Clock.create_trigger(self.draw_baseline_focus_lines)
+		self.bind(size = self.guide_lines_trigger)
 
+	def draw_baseline_focus_lines(self, *args):
+		# ascender and line height straight from the cached font metrics, no text is shaped or rendered
+		font = font_cache.get(self.word_label.font_name, self.word_label.font_size)
+		ascender = font.ascender
+		line_height = font.ascender - font.descender
 
-		# bottom part of baseline
-		bb_l = Line(points = [(x_ofst * 0.5), (y_ofst - ascender - (self.curr_font_size / 2)),
-				(x_ofst * 1.5), (y_ofst - ascender - (self.curr_font_size / 2))],
-				width = 1.2)
+		x_ofst = self.width / 2
+		y_ofst = (self.height / 2) + (line_height / 2) - ascender
 
-		# top part of baseline
-		tb_l = Line(points = [(x_ofst * 0.5), (y_ofst + (ascender * 2)),
-				(x_ofst * 1.5), (y_ofst + (ascender * 2))],
-				width = 1.2)
-		
-		# Color(1, 1, 1, 1)
-		# bottom part of focus
-		bf_l = Line(points = [x_ofst, (y_ofst - ascender - (self.curr_font_size / 2)),
-				x_ofst, (y_ofst - ascender)], width = 1)
-		
-		# top part of focus
-		tf_l = Line(points = [x_ofst, (y_ofst + (ascender * 2)),
-				x_ofst, (y_ofst + ((ascender * 2) - (self.curr_font_size / 2)))], width = 1)
-		
-		self.line_group.add(bb_l)
-		self.line_group.add(tb_l)
-		self.line_group.add(bf_l)
-		self.line_group.add(tf_l)
-		self.canvas.add(self.line_group)
+		bottom = y_ofst - ascender - (self.curr_font_size / 2)
+		top = y_ofst + (ascender * 2)
+
+		# bottom and top part of baseline
+		self.baseline_lines[0].points = [(x_ofst * 0.5), bottom, (x_ofst * 1.5), bottom]
+		self.baseline_lines[1].points = [(x_ofst * 0.5), top, (x_ofst * 1.5), top]
 
-	def clear_lines(self):
-		self.canvas.remove(self.line_group)
+		# bottom and top part of focus
+		self.focus_lines[0].points = [x_ofst, bottom, x_ofst, (y_ofst - ascender)]
+		self.focus_lines[1].points = [x_ofst, top, x_ofst, (top - (self.curr_font_size / 2))]
 
 	# dropdown/popup for files
 	def create_dropdown(self):
@@ -253,59 +332,136 @@ class MainScreen(Screen):
 		popup_file.open()
 	
 	# word manipulation
-	def load_wordlst(self, contents):
-		self.wordlst = contents.split()
+	def load_wordlst(self, words):
+		self.close_wordlst()
+		self.wordlst = words
+		self.reset_playback()
+		self.show_first_word(words)
+
+	# shows the current word once it has been indexed; the first pages of a document can have no text at all
+	# (e.g. an EPUB cover), in which case the background indexer is polled until the words come in
+	def show_first_word(self, words, *args):
+		if words is not self.wordlst: return
+		if len(words) <= self.curr_idx:
+			if words.done: print('Error: no text found in the document')
+			else: Clock.schedule_once(lambda dt: self.show_first_word(words), 0.05)
+			return
+		self.preshape_wordlst()
+		self.prerender_wordlst()
 		self.curr_word = self.wordlst[self.curr_idx]
 		highlighted_letter = self.highlight_letter()
 		self.center_to_highlighted_letter(highlighted_letter)
 
-	def display_next_word(self):
-		if self.is_running == False: return
-		self.curr_idx = (self.curr_idx) % len(self.wordlst)
-		if self.curr_idx == len(self.wordlst) - 1:
-			# end of the word list
-			self.curr_word = self.wordlst[self.curr_idx]
-			self.center_to_highlighted_letter(self.highlight_letter())
-			self.ids['pause'].background_normal = 'imgs/play_icon.png'
-			self.stop_display()
-
-			self.curr_word = self.wordlst[0]
-			self.curr_idx = 0
-			return
-
-		self.curr_word = self.wordlst[self.curr_idx]
-		#self.word_label.text = self.curr_word
-
-		display_time = self.calc_display_time(self.curr_word)
+	# stops everything that still reads the current word list, then releases it
+	def close_wordlst(self):
+		# a document being played is paused, with the button back on play
+		if self.scheduler is not None: self.stop_display()
+		if self.lookahead is not None: self.lookahead.stop(wait = True)
+		self.lookahead = None
+		if self.texture_queue is not None: self.texture_queue.stop()
+		self.texture_queue = None
+		if hasattr(self.wordlst, 'close'): self.wordlst.close()
+
+	# (re)starts background shaping of the upcoming words for the current font
+	def preshape_wordlst(self):
+		if self.lookahead is not None: self.lookahead.stop()
+		if len(self.wordlst) < 1: return
+		self.lookahead = LookaheadShaper(self.wordlst, self.word_label.font_name, self.word_label.font_size,
+								   window = lookahead_window)
+		self.lookahead.move_to(self.curr_idx)
+
+	# (re)starts rendering the textures of the upcoming words for the current font
+	def prerender_wordlst(self):
+		if self.texture_queue is not None: self.texture_queue.stop()
+		self.texture_queue = None
+		if use_glyph_atlas or len(self.wordlst) < 1: return
+		self.texture_queue = WordTextureQueue(self.wordlst, lambda word: focus_markup(word)[1],
+										self.word_label.font_name, self.word_label.font_size,
+										color = self.word_label.color, depth = prerender_depth)
+		self.texture_queue.move_to(self.curr_idx)
+
+	# shaping of the current word, from the lookahead window when it is ready
+	def shaped_curr_word(self):
+		shaped = self.lookahead.take(self.curr_idx)
+		self.lookahead.move_to(self.curr_idx)
+		if shaped is None:
+			metrics = TextMetrics(self.word_label.font_name, self.word_label.font_size)
+			shaped = metrics.get_text_extents_many([self.curr_word]), 0
+		return shaped
+
+	# fresh timeline and scheduler for the current word list
+	def reset_playback(self):
+		if self.scheduler is not None: self.stop_display()
+		self.timeline = PlaybackTimeline(self.wpm)
+		self.scheduler = RSVPScheduler(self.timeline, self.show_word, self.finish_display,
+								 is_complete = lambda: self.wordlst.done, before_tick = self.sync_timeline)
+		self.sync_timeline()
+
+	# adds words indexed since the last call to the timeline
+	def sync_timeline(self):
+		indexed = len(self.wordlst)
+		if len(self.timeline) < indexed:
+			self.timeline.extend(self.wordlst.char_lengths(len(self.timeline), indexed))
+
+	def update_atlas_font(self):
+		if not use_glyph_atlas: return
+		self.atlas_word.set_font(self.word_label.font_name, self.word_label.font_size)
+		self.atlas_word.center_on_focus(self.width / 2, self.height / 2)
+
+	# called by the scheduler whenever the timeline reaches a new word
+	def show_word(self, idx):
+		self.curr_idx = idx
+		self.curr_word = self.wordlst[idx]
 		self.center_to_highlighted_letter(self.highlight_letter())
-		Clock.schedule_once(lambda dt: self.display_next_word(), display_time)
-		self.curr_idx += 1
+		self.curr_idx = idx + 1
+		if self.telemetry.enabled:
+			self.telemetry.word_shown(idx, self.scheduler.scheduled_time(idx))
+			# runs after the label's own texture update on the next frame
+			self.texture_ready_trigger()
+
+	# called by the scheduler once the last word is shown
+	def finish_display(self):
+		# end of the word list
+		self.ids['pause'].background_normal = 'imgs/play_icon.png'
+		self.stop_display()
+
+		self.curr_word = self.wordlst[0]
+		self.curr_idx = 0
 
 	def highlight_letter(self):
-		marked_letter_idx = 0
-		if len(self.curr_word) > 6: marked_letter_idx = math.floor(len(self.curr_word) // 3)
-		elif len(self.curr_word) > 2: marked_letter_idx = math.floor(len(self.curr_word) // 2)
+		marked_letter_idx, text = focus_markup(self.curr_word)
 		
-		letters_before = self.curr_word[:marked_letter_idx]
-		marked_letter = self.curr_word[marked_letter_idx]
-		letters_after = self.curr_word[(marked_letter_idx + 1):]
-
-		self.word_label.text = f'{letters_before}[color=ff7f7f]{marked_letter}[/color]{letters_after}'
+		if use_glyph_atlas:
+			self.atlas_word.set_word(self.curr_word, marked_letter_idx)
+			return marked_letter_idx
+
+		# swap in the texture rendered ahead of time when there is one
+		prerendered = None
+		if self.texture_queue is not None:
+			prerendered = self.texture_queue.take(self.curr_idx)
+			self.texture_queue.move_to(self.curr_idx + 1)
+		if prerendered is not None and prerendered[0] == text:
+			self.word_label.show_prerendered(*prerendered)
+		else:
+			self.word_label.text = text
 
 		return marked_letter_idx
 	
 	def center_to_highlighted_letter(self, marked_letter_idx):
-		if self.word_label.texture is None: return
-		
-		# print(self.word_label.font_name)
-		metrics = TextMetrics(self.word_label.font_name, self.word_label.font_size)
-		glyph_attribs, ascender, descender = metrics.get_text_extents(self.word_label.text,
-																self.word_label.texture_size)
-		if marked_letter_idx >= len(glyph_attribs): return
+		if use_glyph_atlas:
+			self.atlas_word.center_on_focus(self.width / 2, self.height / 2)
+			return
+
+		if self.word_label.texture is None or self.lookahead is None: return
 
-		adv_to_mark = sum(glyph_attribs[i][6] for i in range(marked_letter_idx + 1))
-		marked_letter_spot = glyph_attribs[marked_letter_idx][6]
-		after_mls = sum(attr[6] for attr in glyph_attribs)
+		doc, doc_idx = self.shaped_curr_word()
+		if marked_letter_idx >= len(self.curr_word): return
+		marked_glyph_idx = doc.glyph_for_char(doc_idx, marked_letter_idx)
+
+		texture_width = self.word_label.texture_size[0]
+		adv_to_mark = doc.advance_to_scaled(doc_idx, marked_glyph_idx, texture_width)
+		marked_letter_spot = doc.glyph_advance_scaled(doc_idx, marked_glyph_idx, texture_width)
+		after_mls = texture_width
 
 		scale = self.pos_label.width / (after_mls - 1)
 		dist_to_mark = adv_to_mark * scale * Metrics.dp
@@ -337,20 +493,23 @@ class MainScreen(Screen):
 			if self.wpm > 30:
 				self.wpm = self.wpm - 30
 		elif keycode[1] == 'left':
-			jump_back_sec = 4
-			words_per_sec = float(self.wpm / 60)
-			jump_back_words = int(jump_back_sec * words_per_sec)
-
-			self.curr_idx = max(0, (self.curr_idx - jump_back_words))
+			self.seek_seconds(-4)
 		elif keycode[1] == 'right':
-			jump_fwd_sec = 4
-			words_per_sec = float(self.wpm / 60)
-			jump_fwd_words = int(jump_fwd_sec * words_per_sec)
-
-			self.curr_idx = max(0, (self.curr_idx + jump_fwd_words))
+			self.seek_seconds(4)
+		elif keycode[1] == 't':
+			self.flush_telemetry()
 
 		return True
 
+	# jumps by reading time rather than by a word count
+	def seek_seconds(self, seconds):
+		if len(self.wordlst) < 1: return
+		self.sync_timeline()
+		self.curr_idx = self.timeline.seek(min(self.curr_idx, len(self.timeline) - 1), seconds)
+		if self.lookahead is not None: self.lookahead.move_to(self.curr_idx)
+		if self.texture_queue is not None: self.texture_queue.move_to(self.curr_idx)
+		if self.scheduler.running: self.scheduler.seek(self.curr_idx)
+
 	# gesture stuff
 	def is_within_bounds(self, x, y):
 		return self.x_min <= x <= self.x_max and self.y_min <= y <= self.y_max
@@ -358,101 +517,130 @@ class MainScreen(Screen):
 	def on_touch_down(self, touch):
 		if self.is_within_bounds(touch.x, touch.y):
 			self.clear_gesture()
-			self.gesture_instrct = InstructionGroup()
-			self.gesture_instrct.add(Color(1, 0, 0, 1))
-			d = 30.0
-			e = Ellipse(pos = (touch.x - d / 2, touch.y - d / 2), size = (d, d))
-			touch.ud['line'] = Line(points = (touch.x, touch.y))
-			self.gesture_instrct.add(touch.ud['line'])
-			self.gesture_instrct.add(e)
-			self.canvas.add(self.gesture_instrct)
+			self.gesture_trail = StrokeTrail(touch.x, touch.y)
+			touch.ud['trail'] = self.gesture_trail
+			touch.ud['stroke'] = StrokeBuffer(min_distance = 2 * Metrics.dp)
+			touch.ud['stroke'].add(touch.x, touch.y)
+			self.canvas.add(self.gesture_trail.group)
+			self.gesture_worker.begin()
 			self.is_in_bounds = True
 			return True
 		else: self.is_in_bounds = False
 		return super(MainScreen, self).on_touch_down(touch)
 
 	def on_touch_up(self, touch):
-		if not self.is_within_bounds(touch.x, touch.y) or not self.is_in_bounds:
+		if not self.is_within_bounds(touch.x, touch.y) or not self.is_in_bounds or 'stroke' not in touch.ud:
 			self.clear_gesture()
 			return super(MainScreen, self).on_touch_up(touch)
 
-		g = simple_gesture('', list(zip(touch.ud['line'].points[::2],
-								  touch.ud['line'].points[1::2])))
-
-		g2 = self.gdb.find(g, minscore = 0.5)
-		if g2:
-			if g2[1] == up_arrow:
-				if self.wpm < 1000:
-					self.wpm = self.wpm + 60
-			if g2[1] == down_arrow:
-				if self.wpm > 30:
-					self.wpm = self.wpm - 60
-			if g2[1] == left_arrow:
-				jump_back_sec = 4
-				words_per_sec = float(self.wpm / 60)
-				jump_back_words = int(jump_back_sec * words_per_sec)
-
-				self.curr_idx = max(0, (self.curr_idx - jump_back_words))
-			if g2[1] == right_arrow:
-				jump_fwd_sec = 4
-				words_per_sec = float(self.wpm / 60)
-				jump_fwd_words = int(jump_fwd_sec * words_per_sec)
-
-				self.curr_idx = max(0, (self.curr_idx + jump_fwd_words))
-			if g2[1] == cross:
-				if self.curr_font_size < 60:
-					self.change_font_size(self.curr_font_size + 6)
-			if g2[1] == line:
-				if self.curr_font_size > 6:
-					self.change_font_size(self.curr_font_size - 6)
-			if g2[1] == circle:
-				self.on_press_pauseplaybtn()
+		# the trail goes right away; the stroke is recognized on the worker and acted on when the result is back
+		self.gesture_worker.recognize(touch.ud['stroke'].points,
+								lambda result, event_time: self.on_gesture_result(touch, result, event_time))
 		self.clear_gesture()
 		return super(MainScreen, self).on_touch_up(touch)
 
+	def on_gesture_result(self, touch, g2, event_time):
+		if 'committed' in touch.ud:
+			# already acted while the stroke was drawn
+			self.inflight.record_early(event_time - touch.ud['committed'])
+		elif g2:
+			self.apply_gesture(g2[1])
+			self.inflight.record_action(event_time)
+
 	def on_touch_move(self, touch):
-		if 'line' in touch.ud:
+		if 'stroke' in touch.ud:
 			if self.is_within_bounds(touch.x, touch.y) or self.is_in_bounds:
-				touch.ud['line'].points += [touch.x, touch.y]
+				# points too close to the last one are dropped and never reach the trail
+				if touch.ud['stroke'].add(touch.x, touch.y):
+					touch.ud['trail'].add(touch.x, touch.y)
+					if 'committed' not in touch.ud:
+						self.gesture_worker.score_partial(touch.ud['stroke'].points,
+							lambda result, event_time: self.on_partial_result(touch, result, event_time))
 			return True
 		return super(MainScreen, self).on_touch_move(touch)
 
+	# in-flight recognition: shows the confidence on the trail and acts early once a gesture clearly wins
+	def on_partial_result(self, touch, result, event_time):
+		if result is None or 'committed' in touch.ud: return
+		confidence, commit = result
+		touch.ud['trail'].set_confidence(confidence[1])
+		if commit:
+			self.apply_gesture(confidence[0])
+			self.inflight.record_action(event_time)
+			touch.ud['committed'] = time.perf_counter()
+
+	def apply_gesture(self, name):
+		if name == 'up_arrow':
+			if self.wpm < 1000:
+				self.wpm = self.wpm + 60
+		if name == 'down_arrow':
+			if self.wpm > 30:
+				self.wpm = self.wpm - 60
+		if name == 'left_arrow':
+			self.seek_seconds(-4)
+		if name == 'right_arrow':
+			self.seek_seconds(4)
+		if name == 'cross':
+			if self.curr_font_size < 60:
+				self.change_font_size(self.curr_font_size + 6)
+		if name == 'line':
+			if self.curr_font_size > 6:
+				self.change_font_size(self.curr_font_size - 6)
+		if name == 'circle':
+			self.on_press_pauseplaybtn()
+
 	def clear_gesture(self):
-		if self.gesture_instrct:
-			self.canvas.remove(self.gesture_instrct)
-			self.gesture_instrct = None
+		if self.gesture_trail:
+			self.canvas.remove(self.gesture_trail.group)
+			self.gesture_trail = None
 
 	# display/wpm/font
 	def start_display(self):
+		self.sync_timeline()
 		if self.curr_idx != len(self.wordlst) - 1:
-			Clock.unschedule(self.display_next_word)
-			self.display_next_word()
+			self.scheduler.start(self.curr_idx)
 		else:
 			self.stop_display()
 	
 	def stop_display(self):
 		self.is_running = False
-		Clock.unschedule(self.display_next_word)
+		self.ids['pause'].background_normal = 'imgs/play_icon.png'
+		self.scheduler.stop()
+		stats = self.scheduler.stats()
+		if stats['words_shown'] > 1:
+			print(f"achieved {stats['achieved_wpm']:.0f} wpm, target {stats['target_wpm']:.0f} wpm")
+
+	# the gesture latencies are always kept (a few numbers per gesture), so they are reported even when the
+	# per-word telemetry is off
+	def flush_telemetry(self):
+		if self.telemetry.enabled:
+			summary = self.telemetry.flush(telemetry_path)
+			if summary['words'] > 0:
+				print(f"{summary['words']} words, lateness p50 {summary['texture_p50_ms']:.1f} ms, "
+					  f"p99 {summary['texture_p99_ms']:.1f} ms -> {telemetry_path}")
+		gestures = self.inflight.latency_summary()
+		if gestures['gestures'] > 0:
+			print(f"{gestures['gestures']} gestures, gesture-to-action p50 {gestures['latency_p50_ms']:.1f} ms, "
+				  f"p99 {gestures['latency_p99_ms']:.1f} ms, {gestures['early_commits']} early commits "
+				  f"(p50 {gestures['early_by_p50_ms']:.0f} ms before touch up)")
 	
 	def change_wpm(self, wpm):
 		self.wpm = int(wpm.split()[0])
-	
-	def calc_display_time(self, word):
-		sec_per_word = float(60 / self.wpm)
-		word_itvl = round(float((len(word) / 2.5) * sec_per_word), 4)
-		print(f'{self.wordlst[self.curr_idx]}, {word_itvl}')
-		return word_itvl
 
+	def on_wpm(self, instance, wpm):
+		# rescales every word duration at once
+		self.timeline.set_wpm(max(wpm, 1))
+	
 	def change_font_size(self, curr_font_size):
 		self.curr_font_size = int(curr_font_size)
 
 		self.word_label.font_size = int(self.curr_font_size * Metrics.dp)
 		self.word_label.texture_update()
+		self.preshape_wordlst()
+		self.prerender_wordlst()
+		self.update_atlas_font()
 
-		if self.word_label.texture is None: return False
-		else:
-			self.clear_lines()
-			self.draw_baseline_focus_lines()
+		self.draw_baseline_focus_lines()
 	
 	def change_font_type(self, curr_font_type):
 		self.curr_font_type = curr_font_type
@@ -465,6 +653,10 @@ class MainScreen(Screen):
 		if os.path.exists(fpath):
 			print(fpath)
 			self.word_label.font_name = fpath
+			self.preshape_wordlst()
+			self.prerender_wordlst()
+			self.update_atlas_font()
+			self.draw_baseline_focus_lines()
 		else:
 			print('no path found')
 			return
@@ -490,4 +682,10 @@ class MainApp(App):
 		sm.add_widget(MainScreen(name = 'main'))
 		return sm
 
+	def on_stop(self):
+		# keep newly measured glyphs for the next startup
+		font_cache.save_metrics()
+		self.root.get_screen('main').flush_telemetry()
+		self.root.get_screen('main').gesture_worker.stop()
+
 if __name__ == '__main__': MainApp().run()
\ No newline at end of file
@@ -1,75 +1,87 @@
-from kivy.gesture import GestureDatabase
+# The gesture templates, as strings made by GestureDatabase.gesture_to_str().
+#
+# Nothing is decoded on import: a gesture is decoded the first time it is used, e.g. my_gestures.circle or
+# `from my_gestures import circle`, and kept from then on. The app itself normally loads the precompiled templates
+# from gesture_store and only falls back to these when that file is missing or out of date.
+gesture_strings = {
+    'right_arrow': 'eNprYJnqzc4ABj082ZlllXrpqcUlpUWpU3rY3aGsyVM0G6fUTtHoYS3PTCnJmOLuUKgA0cGWkZqZnlECFCnu/w8E/3r4odrjC4ryU0qTQVICR45wJe941MNeXFKUn51aPCV2SgZDDy/U9GCwIMIOtoL8zLwSkCINoCoeqKoAkCBCEWPFFPf9F289nxHb8KSHsXKKu/0DuQvPDzz+WpqUIQhRkyHivv/c2XZzN56CDFF3+7s6JZdnrJuEKn/oY/PHA7vB8jf4r7SK6P0iTX6zsGfg61MBIPkrifM6/5R9QpUPeLRBtL2AASR/UUbSkvlyHEny9tsWS5WVRYPNP1UsenGnkg1p8sdi9HWaQg+A5A/XR7WuODYHVR5iaQxIfofrXblPazVIk7/GkmhUcWIHSH61+/X1U40ZSJO/WWd3o+FbB0h+6o0q0xImNPlb/gt09suDwn//xMyj04xXHECVv/zj7f27SQ0g+eW5u7ZXbGkgTf7sjtlKG4+eAMlvLGhbmV+BJn9o7U/DrLkg9+/flb/VQ9oqgjR5qKdB8oejTGbfP/8ENf6XnvrB9ycJFD/7T/m+f/5Bu4E0+f3hfx0n6IPlL+TUunzYGUKa/MmavsmbmBaA5C9vYpr6MuYVqvzFIrN3djklIPlr39ufPWKoI03+qkLOyzCVGpD8zQUsFmtY01Dlr4Oct3kOSP6OiIZpWoMQqvytwtSeV3o+IPl78rM7GJ8Flial9vAUJxelpuYhygl3h5oEcHnk7lANLob+twGLnZoGmFgBmAEW2wATU4CL1cqDtbg7VC1AiH2Aqqt8ABerg4sJwMUaDKBi5R8QYi+gYmUIscYTULHSA3CxpgVQsZINcLHmDqhY8QS4WIsHVKwIobflAkxMHu7fVgWoWCFCXSvMfYUIv7VqwMSQ7ID5rTABITYdGi6FYEMYwe77AVVXcAHhZpgdBQi9TRFQsXyEWGMBVCy3ARFWsDjKRqirh6nLTMCMj/R4zPhNRYhVw9JB8n64WBVMXZID3B+VB6BiiQxwOyphehMcEGIOMDEGqN7U0qTEHs6S/JzUosS85FRgzbNzJgjM6mHJS8wF1poMU0qT9ABn07uQ',
 
-gdb = GestureDatabase()
+    'left_arrow': 'eNprYJk6m50BDHp4sjPLKvXSU4tLSotSp/Swu0NZk6doNk6pnaLRw1qemVKSMcXdofwBRAdbRmpmekYJUKTEACLCD9UeX1CUn1KaDJISElqbfiW8qYe9uKQoPzu1eErslAyGHl6o6cFgQYQdbAX5mXklIEUaQFU8UFUBIEGEIsaKKe72t4oaPNtmS/QwVgI5Nx3jKsWq5pUmZQhC1GSIuNtfPTglJZR5QYaou/31KeUfEozsUOUvWJlanXD/A5K/MqFo8pPHWqjyxzOiEuQWHQDJXzL/s9BHvAhVfnuMpJtrgAFI/tzebXaTLqWQJL/fosl401IBBpD8ye1MS/J/uqDK73hi05i/kAMkf2SDP5evggpp8ieu/06f5tcCkt//75iXuWAGafIXP8fcDX/0AiS//Qtv8IyXCqjy187rzGWSNgLJb5jy+NhdFw9U+Vsrl9re6CsDyS8ruPB+UrAAqvzdtatmBd/tAclPz9+y6IrVAVT5+1ETlblU34DkWwQZdjm/b0Azv+5gcvxbUPzun11370zW4Qeo8tdVvgR+jnkAkl95vuWG0rwAVPlLJy8obmaXAMlv+VSdtL48AlX+FNgDU0Dy+1cXMVxf84M0+T0vZ/zZt1UDJH/MuDsveBua/WW/BMqr9oDif/9Zm7ducpItJMnb74w73vzmVgBI/uLZ+FtMf1aRJn/qkHpht3EDSP6qus7r/N4c0uQv21lNd54uAJK/fjVr0s9Zl1Hlb0hxhb09HwOSv3lD4sJClUeo8reLrwNzmAxI/ra++ZI07cmo8veURPmf5ILS5/47Bn2HLT/MKU1K7eEpTi5KTc1DlBPuDo0TwKWPu0PNBjCjbQoOMQ+YGFiSESzGARNLgKtr2AATE0CIBUDFqtf/BwGQWD1MrOoDXF3tApgYQm91AVSskgEuVukAFatAqCsDG8MILGAV4GIlMPPKHOBuLoL5rbQe7paCA1CxkgtwvXkwvSUBcL05CVCxYoS6bAWYWANcLAumt9gfbgdCzB4ulg3zR7E+XCwH5pYiRLjkwcUWwMUKYOYVIcKgCGZeYQAiDGBiBQixMlgY5CHCpRLmj+z5cLdUL4CGaaYDXG8dzLy0A4j4tYCKpSDEGmHmJSP82wjzRxLC3iaYeYmI+GjqgInJI8RmwMRg6SC1NCmxh7MkPye1KDEvORVYk+2cCQKzeljyEnOBtTDDlNIkPQA/8sj8',
 
-right_arrow = gdb.str_to_gesture('eNprYJnqzc4ABj082ZlllXrpqcUlpUWpU3rY3aGsyVM0G6fUTtHoYS3PTCnJmOLuUKgA0cGWkZqZnlECFCnu/w8E/3r4odrjC4ryU0qTQVICR45wJe941MNeXFKUn51aPCV2SgZDDy/U9GCwIMIOtoL8zLwSkCINoCoeqKoAkCBCEWPFFPf9F289nxHb8KSHsXKKu/0DuQvPDzz+WpqUIQhRkyHivv/c2XZzN56CDFF3+7s6JZdnrJuEKn/oY/PHA7vB8jf4r7SK6P0iTX6zsGfg61MBIPkrifM6/5R9QpUPeLRBtL2AASR/UUbSkvlyHEny9tsWS5WVRYPNP1UsenGnkg1p8sdi9HWaQg+A5A/XR7WuODYHVR5iaQxIfofrXblPazVIk7/GkmhUcWIHSH61+/X1U40ZSJO/WWd3o+FbB0h+6o0q0xImNPlb/gt09suDwn//xMyj04xXHECVv/zj7f27SQ0g+eW5u7ZXbGkgTf7sjtlKG4+eAMlvLGhbmV+BJn9o7U/DrLkg9+/flb/VQ9oqgjR5qKdB8oejTGbfP/8ENf6XnvrB9ycJFD/7T/m+f/5Bu4E0+f3hfx0n6IPlL+TUunzYGUKa/MmavsmbmBaA5C9vYpr6MuYVqvzFIrN3djklIPlr39ufPWKoI03+qkLOyzCVGpD8zQUsFmtY01Dlr4Oct3kOSP6OiIZpWoMQqvytwtSeV3o+IPl78rM7GJ8Flial9vAUJxelpuYhygl3h5oEcHnk7lANLob+twGLnZoGmFgBmAEW2wATU4CL1cqDtbg7VC1AiH2Aqqt8ABerg4sJwMUaDKBi5R8QYi+gYmUIscYTULHSA3CxpgVQsZINcLHmDqhY8QS4WIsHVKwIobflAkxMHu7fVgWoWCFCXSvMfYUIv7VqwMSQ7ID5rTABITYdGi6FYEMYwe77AVVXcAHhZpgdBQi9TRFQsXyEWGMBVCy3ARFWsDjKRqirh6nLTMCMj/R4zPhNRYhVw9JB8n64WBVMXZID3B+VB6BiiQxwOyphehMcEGIOMDEGqN7U0qTEHs6S/JzUosS85FRgzbNzJgjM6mHJS8wF1poMU0qT9ABn07uQ')
+    'up_arrow': 'eNqVlW1IE2EcwCeZM1iokdAbKH6aZREWFVJtGHSVUpNWH7Ryb6e3pm7ddrnZlpvalDgo2QkWvblUqg+5YpRWMouKXshtmmahuaAo6oNRRBK93XN77h4u+nL3Zdvv9///n5f/c8+8qR12uYx7aIXFfNi1qhq3OygSZ2g5Br8FmHwf42GU9Nx6s8lBMJiaDCUz0gjcXE04WEJ5kyQDplfaSKuJMgK1oCVepJ05QMvtDtJqwe3MfoaQ0fNh9d0cRGOk2azmOgcIUrJRChilARAFpTgZLDJ1xX2kakeYTnGxPyYDM9VzapsoA5GVjCEWYpFXIVtg3eVZIhuLTCybOn77p0HsJ57n5y165wZ+LC8epCuCYj9O/KHIwgTwMXeO/O5nt9iPnmNKHtCrgX8w3E7EtxaIfay7zdjxyQb8tfaiYMqzmDT/5NtN18MuDetVl6qc0+GvGmn+fvBAgd7SD/z9TXsfRp1aaX5wH92fqgXzU8WKjV+2f78h9tcLE1llAyHgx+pnH50tS5PmuxTkYO1rL/AvdUpzxegPsd/Tq1T8KpUBP7k8EEhvuCryqh7gS3TATzcnZjdn+MU+lH5pMv4b9E81Ed+6cuTduNiHG28NLLblAv98gGI7OCL2d/oq6s8czAT+GXt6TDvD0vy94Uhndq8S+Lvs6ep5+o9/7Cs3eKMx4N2+gjUbrV5pPgpOZ5YanJ9B18HiIU1Mmh95iw/lXeTO3/B+e3f52lJpfmzXiZrHezO59+eN9kznlnFp/sWK8an3S9qAf9UmX2+4+lvsJ0D7PnLv3+vMbxVLNyUoA04r7EYSx+vQPYGp3bnc7YOpjZV/wONnrx23DjIT95nCsRBkePLKA8yTw6Vg6iqdEOcZgnEEYkdPQmZpFMZo9EJmVQv1vGrIDsUQewSZQyPU82kgOxwS4nwxyJxDAmvaBlmDV8ht4tdxJCrMpTkdMjfKbeZzPTrEbDyLoNxkaZYlUJzA0Dqa2/5Tr/M/4/bz8zuPxvgA6zWgvWrh98qpFtbWcoHfF8SOrYbMbhXqHeuDfbOh+fk3wLga1Dc/X696Wsj1f4ZzMaE5t/JjGNDaWvke6VHPW/lzpc9BjIBMx9fDKYOenuew1uCkvs6IM5hq4BR4TtOpdfpa9t9VxlCGVX8BaFLXtQ==',
 
-left_arrow = gdb.str_to_gesture('eNprYJk6m50BDHp4sjPLKvXSU4tLSotSp/Swu0NZk6doNk6pnaLRw1qemVKSMcXdofwBRAdbRmpmekYJUKTEACLCD9UeX1CUn1KaDJISElqbfiW8qYe9uKQoPzu1eErslAyGHl6o6cFgQYQdbAX5mXklIEUaQFU8UFUBIEGEIsaKKe72t4oaPNtmS/QwVgI5Nx3jKsWq5pUmZQhC1GSIuNtfPTglJZR5QYaou/31KeUfEozsUOUvWJlanXD/A5K/MqFo8pPHWqjyxzOiEuQWHQDJXzL/s9BHvAhVfnuMpJtrgAFI/tzebXaTLqWQJL/fosl401IBBpD8ye1MS/J/uqDK73hi05i/kAMkf2SDP5evggpp8ieu/06f5tcCkt//75iXuWAGafIXP8fcDX/0AiS//Qtv8IyXCqjy187rzGWSNgLJb5jy+NhdFw9U+Vsrl9re6CsDyS8ruPB+UrAAqvzdtatmBd/tAclPz9+y6IrVAVT5+1ETlblU34DkWwQZdjm/b0Azv+5gcvxbUPzun11370zW4Qeo8tdVvgR+jnkAkl95vuWG0rwAVPlLJy8obmaXAMlv+VSdtL48AlX+FNgDU0Dy+1cXMVxf84M0+T0vZ/zZt1UDJH/MuDsveBua/WW/BMqr9oDif/9Zm7ducpItJMnb74w73vzmVgBI/uLZ+FtMf1aRJn/qkHpht3EDSP6qus7r/N4c0uQv21lNd54uAJK/fjVr0s9Zl1Hlb0hxhb09HwOSv3lD4sJClUeo8reLrwNzmAxI/ra++ZI07cmo8veURPmf5ILS5/47Bn2HLT/MKU1K7eEpTi5KTc1DlBPuDo0TwKWPu0PNBjCjbQoOMQ+YGFiSESzGARNLgKtr2AATE0CIBUDFqtf/BwGQWD1MrOoDXF3tApgYQm91AVSskgEuVukAFatAqCsDG8MILGAV4GIlMPPKHOBuLoL5rbQe7paCA1CxkgtwvXkwvSUBcL05CVCxYoS6bAWYWANcLAumt9gfbgdCzB4ulg3zR7E+XCwH5pYiRLjkwcUWwMUKYOYVIcKgCGZeYQAiDGBiBQixMlgY5CHCpRLmj+z5cLdUL4CGaaYDXG8dzLy0A4j4tYCKpSDEGmHmJSP82wjzRxLC3iaYeYmI+GjqgInJI8RmwMRg6SC1NCmxh7MkPye1KDEvORVYk+2cCQKzeljyEnOBtTDDlNIkPQA/8sj8')
+    'down_arrow': 'eNptln1MU1cUwFsHshEYiJJJokJCDLglBmUxGDbbmM1uc4MiIrCJQuGNFpBW2tcvSimsJZqVrZEHQ2WRZSFz2RxE3RzgKAMWGOoo3x8iMCCM7A/ogvMLIuM+3n2nV9e/Xn6/c+6559x3X2rxqmz2FbA/u1+uQmvYnU2pNXQBxdh9JNxTBbOrhCliIu3eOkWWRs5IxLRqPWOjnFJkyzVrxBC2TgK49JOqAmUWnYlUkCWhIuZpiN1HrSlQ5lJqJo2RC+z+3OqJLIQaG1VKRb4GBUWuRflxUVIEIUioZyTOEVXqIn3tQ7vQwEhEk79Ezt/osdAy+ab1GPkWiXNY+OnFj3Pa5MES0Zhwsdp4ZRvpB5vNE3/5dyE/OHEoerzFTfqB8IUlyagD+V5FSO2Ox1bS9/0YdinG8QD57v1pkmmRnvS9Xwwa3w2tQb7DHP6wbvsW0vfU+yxEr55B/ifr5wc3a18k/e3e3EPB+SnIVx4uf1sV+0x/3fMprx2TTa15Z4XW973CzFbSdzbGHH3liR755ogMOvHaI9L/5tq5P2XhEfLtcX/7zq2kk74tvnTvk3op8ndc/TuEzXmkb5m5FfzzG1HI980kHH956i3SN96qDm/qYvOHgk5Hf/DOddJfDzzRX1TnRn6s4eSJC49vkv6KO7ldkCVAfqLUxoQEXiZ95Xd7lJunW1mf2r5ydqcv4UVls9G5N7az+XeF0+VNrmXSf1Pu3DU7zs5vKHZv973Xj5C+YTKobHE6Hfn+suSmuM+cpL+ZZIvIiQhDvntpHz3z6gHS/5o6nbNkYut3zBkelEXVkL7j7IaDe2ZVyLccK3n/3Dby/RH9Hn/VO6BkK/LfvvDl8j5/B+n/yJ596PcvWl9UszjakKcQk95lWI3xHkbnL7oaIPshqaGW9H33kkM0dbeRb6sMHJ/b9IwfCM8cvL+BvR+dvm+qvh72Iv3QyIG50svs+9lzv6o6NGOc9KOxVZ3/aL9HfkCpm7yjTSH92PL84bAqK/LDnalxF7vlpB+fXaYmv1pB/u75YmvIn1JaRtn91JkFFJUP3wmJWLv+9ZGIi8TsQxnjyaKARWEmeJ6ZpoCxywjXmIV9YJkUx3msp+JYYf0q+rGsATOPGm5uPSPk6nBdQzowC8f0UFfn4pjuEl9DH8gxrYvP1adzjHYDw7kaiDPgumro14DrqmHPBpxbEMrXNeK6p6V8nBHPQOXBWjmWD30UBrDLSMR5YmA4N0cAzMnFyYGZ8FlSU8CUXFxWGDA8e1krvxeTm2MZxXwfRXgG6fC+FOH5pTkhzsGxj9i4DSzDvaV65OIayRBnFnAsCdYz4z6OwgzMYo4leuTid+2ICKU+ZRmeVQL0wTMp9GvGZym1AHP8D8OzSoAzN+M+Elb5usV4VolwlsWO53uz4H5TYC8WnHsc+rXgPafDuVn4c/OIw3vJgvtRgmeVDXsuwXtReMRNcSwX7kwpnv0piCtN4ZgyDFg1fp9hVqUj+L0H9slWfD8cwPC5qT3i8P40KmD4btHx/P6s/J2GuVjx/nSBfK4Vr6eD+2vF6+nhnltXufthgPfFFsnFGaFfG96zsQEY/12D75XtDGYwU1st/ibCedjqubomuB82fGdMDr43WxdmHnV5ht8hipZl2F/SKPOogoz8TGrtn17jefS7YPfKzzi19i9VwNCy3f8BQPeeRg==',
 
-up_arrow = gdb.str_to_gesture('eNqVlW1IE2EcwCeZM1iokdAbKH6aZREWFVJtGHSVUpNWH7Ryb6e3pm7ddrnZlpvalDgo2QkWvblUqg+5YpRWMouKXshtmmahuaAo6oNRRBK93XN77h4u+nL3Zdvv9///n5f/c8+8qR12uYx7aIXFfNi1qhq3OygSZ2g5Br8FmHwf42GU9Nx6s8lBMJiaDCUz0gjcXE04WEJ5kyQDplfaSKuJMgK1oCVepJ05QMvtDtJqwe3MfoaQ0fNh9d0cRGOk2azmOgcIUrJRChilARAFpTgZLDJ1xX2kakeYTnGxPyYDM9VzapsoA5GVjCEWYpFXIVtg3eVZIhuLTCybOn77p0HsJ57n5y165wZ+LC8epCuCYj9O/KHIwgTwMXeO/O5nt9iPnmNKHtCrgX8w3E7EtxaIfay7zdjxyQb8tfaiYMqzmDT/5NtN18MuDetVl6qc0+GvGmn+fvBAgd7SD/z9TXsfRp1aaX5wH92fqgXzU8WKjV+2f78h9tcLE1llAyHgx+pnH50tS5PmuxTkYO1rL/AvdUpzxegPsd/Tq1T8KpUBP7k8EEhvuCryqh7gS3TATzcnZjdn+MU+lH5pMv4b9E81Ed+6cuTduNiHG28NLLblAv98gGI7OCL2d/oq6s8czAT+GXt6TDvD0vy94Uhndq8S+Lvs6ep5+o9/7Cs3eKMx4N2+gjUbrV5pPgpOZ5YanJ9B18HiIU1Mmh95iw/lXeTO3/B+e3f52lJpfmzXiZrHezO59+eN9kznlnFp/sWK8an3S9qAf9UmX2+4+lvsJ0D7PnLv3+vMbxVLNyUoA04r7EYSx+vQPYGp3bnc7YOpjZV/wONnrx23DjIT95nCsRBkePLKA8yTw6Vg6iqdEOcZgnEEYkdPQmZpFMZo9EJmVQv1vGrIDsUQewSZQyPU82kgOxwS4nwxyJxDAmvaBlmDV8ht4tdxJCrMpTkdMjfKbeZzPTrEbDyLoNxkaZYlUJzA0Dqa2/5Tr/M/4/bz8zuPxvgA6zWgvWrh98qpFtbWcoHfF8SOrYbMbhXqHeuDfbOh+fk3wLga1Dc/X696Wsj1f4ZzMaE5t/JjGNDaWvke6VHPW/lzpc9BjIBMx9fDKYOenuew1uCkvs6IM5hq4BR4TtOpdfpa9t9VxlCGVX8BaFLXtQ==')
+    'line': 'eNprYJnqzsYABj082ZlllXrpqcUlpUWpU3rY3aGsyVM0G6fUTtHoYS3PTCnJmOLuUL0BooMtIzUzPaMEKCIBFnDo4Ydqjy8oyk8pTQZJsaZf0Ra1/dTDXlxSlJ+dWjwldkoGQw8v1PRgsCDCDraC/My8EpAiDaAqHqiqAJAgQhFjxRT3/Q+ZX607tjKxh7ESyCnhqNwb+ZWhNClDEKImQ8R9/72tRukJ9hsyRHHI327vTl1SYEO2/PVXH9qmXH1HtvylSW1GZgIBZMufnBbAyPZ/A83k9/CrWzvvbaCZ/Iw0iwS+JAaQfOqkn05CMtSVt9+0f5eK6JUDIHmL5T+8mzKoLH9EYOOuE6ULaCZ/rryvanElKH7s4y5+i0tmIlH+CoPj/tclHCD5gs9Vm18up7L89WdX2u9O7cEpf+tU84Jtd0+A5KuMyi9Y9ZEof2e1P1e5zx6QfOOOXWWuux1Kk1J7eIqTi1JT8xDlhLtD2QRw8ePuUPgAzGgDFjvlCphiFQyYYpUJmGJVH0AsRhSxWgdMdfX7/4MAilgjFnubAmBiH+BizSugYkUMcLGWC5hirR9gYgJwsbYfMDF5sANAYu0XMMU6CmBi+gixGzAxsIcYQWKdHFjEFNDFUkuTEns4S/JzUosS85JTp7jb75wJArN6WPISc4E1BsOU0iQ9AOOwXIE=',
 
-down_arrow = gdb.str_to_gesture('eNptln1MU1cUwFsHshEYiJJJokJCDLglBmUxGDbbmM1uc4MiIrCJQuGNFpBW2tcvSimsJZqVrZEHQ2WRZSFz2RxE3RzgKAMWGOoo3x8iMCCM7A/ogvMLIuM+3n2nV9e/Xn6/c+6559x3X2rxqmz2FbA/u1+uQmvYnU2pNXQBxdh9JNxTBbOrhCliIu3eOkWWRs5IxLRqPWOjnFJkyzVrxBC2TgK49JOqAmUWnYlUkCWhIuZpiN1HrSlQ5lJqJo2RC+z+3OqJLIQaG1VKRb4GBUWuRflxUVIEIUioZyTOEVXqIn3tQ7vQwEhEk79Ezt/osdAy+ab1GPkWiXNY+OnFj3Pa5MES0Zhwsdp4ZRvpB5vNE3/5dyE/OHEoerzFTfqB8IUlyagD+V5FSO2Ox1bS9/0YdinG8QD57v1pkmmRnvS9Xwwa3w2tQb7DHP6wbvsW0vfU+yxEr55B/ifr5wc3a18k/e3e3EPB+SnIVx4uf1sV+0x/3fMprx2TTa15Z4XW973CzFbSdzbGHH3liR755ogMOvHaI9L/5tq5P2XhEfLtcX/7zq2kk74tvnTvk3op8ndc/TuEzXmkb5m5FfzzG1HI980kHH956i3SN96qDm/qYvOHgk5Hf/DOddJfDzzRX1TnRn6s4eSJC49vkv6KO7ldkCVAfqLUxoQEXiZ95Xd7lJunW1mf2r5ydqcv4UVls9G5N7az+XeF0+VNrmXSf1Pu3DU7zs5vKHZv973Xj5C+YTKobHE6Hfn+suSmuM+cpL+ZZIvIiQhDvntpHz3z6gHS/5o6nbNkYut3zBkelEXVkL7j7IaDe2ZVyLccK3n/3Dby/RH9Hn/VO6BkK/LfvvDl8j5/B+n/yJ596PcvWl9UszjakKcQk95lWI3xHkbnL7oaIPshqaGW9H33kkM0dbeRb6sMHJ/b9IwfCM8cvL+BvR+dvm+qvh72Iv3QyIG50svs+9lzv6o6NGOc9KOxVZ3/aL9HfkCpm7yjTSH92PL84bAqK/LDnalxF7vlpB+fXaYmv1pB/u75YmvIn1JaRtn91JkFFJUP3wmJWLv+9ZGIi8TsQxnjyaKARWEmeJ6ZpoCxywjXmIV9YJkUx3msp+JYYf0q+rGsATOPGm5uPSPk6nBdQzowC8f0UFfn4pjuEl9DH8gxrYvP1adzjHYDw7kaiDPgumro14DrqmHPBpxbEMrXNeK6p6V8nBHPQOXBWjmWD30UBrDLSMR5YmA4N0cAzMnFyYGZ8FlSU8CUXFxWGDA8e1krvxeTm2MZxXwfRXgG6fC+FOH5pTkhzsGxj9i4DSzDvaV65OIayRBnFnAsCdYz4z6OwgzMYo4leuTid+2ICKU+ZRmeVQL0wTMp9GvGZym1AHP8D8OzSoAzN+M+Elb5usV4VolwlsWO53uz4H5TYC8WnHsc+rXgPafDuVn4c/OIw3vJgvtRgmeVDXsuwXtReMRNcSwX7kwpnv0piCtN4ZgyDFg1fp9hVqUj+L0H9slWfD8cwPC5qT3i8P40KmD4btHx/P6s/J2GuVjx/nSBfK4Vr6eD+2vF6+nhnltXufthgPfFFsnFGaFfG96zsQEY/12D75XtDGYwU1st/ibCedjqubomuB82fGdMDr43WxdmHnV5ht8hipZl2F/SKPOogoz8TGrtn17jefS7YPfKzzi19i9VwNCy3f8BQPeeRg==')
+    'cross': (
+        'eNq1l9tu3DYQhu/1It6bLjicE+cFtrcF/ACBYwv2Iqkt7G7a5u1DDqlT0lZ7I2Mxsj5JP2f4k'
+        'xR1OH85//X9+Npfb98uffd7Ow6hO7wM0D0+vD/92T90Q8z/5gN218eH6+3y8aW/5lPqDl8H7g'
+        '7/KvLot3WDFCnNzw8f5/dbeSyVx+w/Hvuj3NUNUDMoKXzPj0DsTuGIGiRJGCOVbP4pV7E7/Ra'
+        'ORJZMwhS1u35++v9WyFvh7rU2ENEMJI1RuLu+NnEEgyhpjEG2xb1y0H3Ek4vbKA6kEmyKEWdx'
+        'WPaJsaVN8eidH2Ef8ejiOIqHdbeQLvolaLTFLxlty7ulsVlaNBKChCnmEpp+uRSSIozRBLbl3'
+        'dSoe8m7rdF2kkc3FmGSB1FVphYT6qSejY2sOsXtyYRuLOIkHgEtGrZIKJP4Spk13ZG524qzrX'
+        'FWLlHmfok/9UvcFndTUe8Rz8OVA7RIYXtAoluKdke3hJU42j0dQ24pwV7ybiptm1oGE+Rz4il'
+        'u9w25q8R3qQtnZ2WKd+TutpLeox4pZmt1jHlh3VR3X8nuUceFdIm4qc5uKy9mapCY339jXKb+'
+        '08tjewlmN5VxH3H3lBcLcASZfzGv4osFPiVk5SnmCb6p766y7qbvvvL0Zg2GKtHGCDjPJ2FKi'
+        'cfI2wuNuKsCu2i7qYLzdiP3BXGLYIs1DEAo0hh1eyaJeyq8i7b7KdM26ddNXpPO7SCSTnHbSn'
+        'ErxXaQVndSJyeJGQOMMe+RJm1aLrk5bku7kYp7SLuPOvlI6/FHs4+87hH2Fats/p8vff8+beV'
+        'Vyl5etTucMA/a7kSE+XAbNHVPmcGK2ZKBsxSciTPUyqAwUmdRKouFCToDqgwLU3MWQmVUmDnD'
+        '1O7jwsCfOuXFt0JxGKNDaS1rhVwhV5gqpBW0CnEJLaw0G4QKwwrGmlJaQaxw1bp5QRBsBb2iZ'
+        'MvczQtSWjGvx09m5uXwmnk1tNKDEGYbZli94TX0aqg1nRrE5Z3WoFdDtWyFBr0aqR2URljLqa'
+        '1bbNDrsToywth69QfqGIrcaDVoPSoBqkNtbDE1Wi3iqsAtV6gesSdL0vKCalLNdqa5rjpB3vr'
+        'z69utfJTmz8qTFclM/z6/3N4cSteSyvT28bW/PL0/935Ffdsd1n9Q7muT+dNw+Xj59lzFU+6W'
+        'Y5L8ug5qwTR/PFH5bDz+AM/6Dqo='),
 
-line = gdb.str_to_gesture('eNprYJnqzsYABj082ZlllXrpqcUlpUWpU3rY3aGsyVM0G6fUTtHoYS3PTCnJmOLuUL0BooMtIzUzPaMEKCIBFnDo4Ydqjy8oyk8pTQZJsaZf0Ra1/dTDXlxSlJ+dWjwldkoGQw8v1PRgsCDCDraC/My8EpAiDaAqHqiqAJAgQhFjxRT3/Q+ZX607tjKxh7ESyCnhqNwb+ZWhNClDEKImQ8R9/72tRukJ9hsyRHHI327vTl1SYEO2/PVXH9qmXH1HtvylSW1GZgIBZMufnBbAyPZ/A83k9/CrWzvvbaCZ/Iw0iwS+JAaQfOqkn05CMtSVt9+0f5eK6JUDIHmL5T+8mzKoLH9EYOOuE6ULaCZ/rryvanElKH7s4y5+i0tmIlH+CoPj/tclHCD5gs9Vm18up7L89WdX2u9O7cEpf+tU84Jtd0+A5KuMyi9Y9ZEof2e1P1e5zx6QfOOOXWWuux1Kk1J7eIqTi1JT8xDlhLtD2QRw8ePuUPgAzGgDFjvlCphiFQyYYpUJmGJVH0AsRhSxWgdMdfX7/4MAilgjFnubAmBiH+BizSugYkUMcLGWC5hirR9gYgJwsbYfMDF5sANAYu0XMMU6CmBi+gixGzAxsIcYQWKdHFjEFNDFUkuTEns4S/JzUosS85JTp7jb75wJArN6WPISc4E1BsOU0iQ9AOOwXIE=')
+    'circle': 'eNp1l31MG3UYxw/CgAlzlaBhRk2jmFSdhBiz1DnTy7LlFpdpFV8ImVl5OXoMaLu+0B6B0tcxtAkkHtlcwsQoG2YjwBxu6EwhsmzEOdnmpGRsFBcjuinMRCUzir3jnnt6vev908vn+/x+z+95+T2X+rK63esI4Ynk19c1sSVm2uF02WkukkOJb+9zT/m5Vk4XWeOuq3EyHEU2kqsrshm6zsw4E8QaXeGfyHpx+R6b3VrjquYlrWv4r18HliM5DqfdWk87uHc4hoisE3cvEyD6yLZZ6yxO3kiXsMoXrYw8RKMMD0dFx7SkPzNLE8lgOcow0x87MXx1t6uKeWDVhimkope2eO7eOt/LPEgZYj+/ebTvy41y/drxtwYqRjy8/v2RiVDlc4VyfXpxLur9j+D1KxUv2rf8ckCuX9/UMPNZ7RSvTz66o33MpJXrNwX/HK9/nql99qsXSLk+5/33n78XF3j9YLv35J1rhFyPJ+LL1RQn9Ojp8u6XiuyaFH08mJ1f9DyvT1L+PPqOLUX/aGv4vsKNvH7F+vap9YNDKf6j/AGWeX36XmOcqUzZ/0bzn7enB2t4fXYiI/vUva1yPZaIrvOxbbw+n7OzKHR5MiW/e/kMm3j9x7Wvark/8uT6Rb1t/ut2raDfLjj28f0p+48/vq2joNjI67fyynR9BTvl+ic6YyJCMp1u6C81jQfXjAn7v/tacU/mM3L93NNvfPp6n7B+nrr48IGZWbm+2j8+Xo9vv1DgGT0s168ee6VnszOeLj+GH367ftpy44yQX7Z+1mT8Xa7HhqvOvfeQjtcvN5YdX+lk5PqM/advDpaU8/r5ieaVXWc1afXR3T279Ce7UvYX6qPn9Y5A8c1Bhkh3PsMI8ciTAxuIdPEZJrhN1e7vctPlx/Dt0YoTuXfL5fpEIrsvd2uF+7PhC5t+3iPXR4T8m4T7N7d9P725WF7fLuGGC/tPP3HpUEfgrKuKjuQ7qu00bcE5QZH+LmEeUWRzXHjZz6VhNmBLyIwqTKtkvgXlfr4hYEPIJB8+/jdDYDpgWsmubXViUiT7ofAisFLRjtVIdt4pkXlwP69JeKVIN671EqJd05S0trVXZC48cyvE60xiGpE5MN6WJWB4lpa4yOykdJYWON8+E9oBs/Uq11rnpDNLfi0YWyspskbMVatPZPVJa8HH3jHMFdStLikvsJbBeL0QG6OV/LaZRGZuw3qADzOexQc1qkW/Pg8wE9Yc1tZirqS+qkW/fp8KiytZgFRhvUq/gUWxr2ox90G92C9mAhncD/MeKd4g+DVjnkPQuwz6CNmUOQ31Q+6xD0IxqBGBa1fE8yXVLQw+6jH3YUq0a0C/YQZ6A32EIX+WJLsuMV5rkh3kylaKdv3KPg0Pin73Yd+Hz0CPdymZXcXO7lNhS0rmsGK84NeBOZXO5zTimQ8Bw5kjxevSKPPiSvIB+XPhjAjDPGhKyoseWFIcWuV8kWrpRr8hmJNuIzK4C+5O7CuYnW7sgxD0pAf7VOo1D54vVA4sqSdJ5ZwMwZk9mKtQLjCMIwjzwIM1CkLvskl35gIwnAdBiIMtRQY1YjEHQZ9YIxbrEYR6sNj3QahH0ndBur/sIDKIjcX8BSE2FntImgcsxhaA2JoxtsAYMKxloF/53QpI31WMNyB980hkJhW2Axj2c0CvwrQqTKPCclUYoWT+ZRW2pMIWVFhchcVU2FQqo11VlZG1TmsDba+0VNOJfymjH/DP4UiWpbIx8Q+L4FxVJf8Do0JS0w==',
 
-cross = gdb.str_to_gesture(
-    'eNq1l9tu3DYQhu/1It6bLjicE+cFtrcF/ACBYwv2Iqkt7G7a5u1DDqlT0lZ7I2Mxsj5JP2f4k'
-    'xR1OH85//X9+Npfb98uffd7Ow6hO7wM0D0+vD/92T90Q8z/5gN218eH6+3y8aW/5lPqDl8H7g'
-    '7/KvLot3WDFCnNzw8f5/dbeSyVx+w/Hvuj3NUNUDMoKXzPj0DsTuGIGiRJGCOVbP4pV7E7/Ra'
-    'ORJZMwhS1u35++v9WyFvh7rU2ENEMJI1RuLu+NnEEgyhpjEG2xb1y0H3Ek4vbKA6kEmyKEWdx'
-    'WPaJsaVN8eidH2Ef8ejiOIqHdbeQLvolaLTFLxlty7ulsVlaNBKChCnmEpp+uRSSIozRBLbl3'
-    'dSoe8m7rdF2kkc3FmGSB1FVphYT6qSejY2sOsXtyYRuLOIkHgEtGrZIKJP4Spk13ZG524qzrX'
-    'FWLlHmfok/9UvcFndTUe8Rz8OVA7RIYXtAoluKdke3hJU42j0dQ24pwV7ybiptm1oGE+Rz4il'
-    'u9w25q8R3qQtnZ2WKd+TutpLeox4pZmt1jHlh3VR3X8nuUceFdIm4qc5uKy9mapCY339jXKb+'
-    '08tjewlmN5VxH3H3lBcLcASZfzGv4osFPiVk5SnmCb6p766y7qbvvvL0Zg2GKtHGCDjPJ2FKi'
-    'cfI2wuNuKsCu2i7qYLzdiP3BXGLYIs1DEAo0hh1eyaJeyq8i7b7KdM26ddNXpPO7SCSTnHbSn'
-    'ErxXaQVndSJyeJGQOMMe+RJm1aLrk5bku7kYp7SLuPOvlI6/FHs4+87hH2Fats/p8vff8+beV'
-    'Vyl5etTucMA/a7kSE+XAbNHVPmcGK2ZKBsxSciTPUyqAwUmdRKouFCToDqgwLU3MWQmVUmDnD'
-    '1O7jwsCfOuXFt0JxGKNDaS1rhVwhV5gqpBW0CnEJLaw0G4QKwwrGmlJaQaxw1bp5QRBsBb2iZ'
-    'MvczQtSWjGvx09m5uXwmnk1tNKDEGYbZli94TX0aqg1nRrE5Z3WoFdDtWyFBr0aqR2URljLqa'
-    '1bbNDrsToywth69QfqGIrcaDVoPSoBqkNtbDE1Wi3iqsAtV6gesSdL0vKCalLNdqa5rjpB3vr'
-    'z69utfJTmz8qTFclM/z6/3N4cSteSyvT28bW/PL0/935Ffdsd1n9Q7muT+dNw+Xj59lzFU+6W'
-    'Y5L8ug5qwTR/PFH5bDz+AM/6Dqo=')
+    'check': (
+        'eNq1l0tuI0cMhvd9EXsTofgmL6BsA/gAgcYWbGMmtmBpksztwyY1kgZI0rNpbdr+u+pjkX+9+'
+        'v718+uf3zbP++Pp68d++vX8PIzp/ukA08Pd2+6P/d10wPwzHzQdH+6Op4/3z/tj/svT/ZeDTP'
+        'f/CnmoZtNBZ5Rl/8P769tp7uZzt/iPbr/NraYD9AjmIXzLLoDTdmxgBLsSMMIw5OHzcP6eX9O'
+        '0/WVsCMFGmCuaGgjBdPy0+/8wXGFkeu4Ig7LzgISbMw/j6fh8hmMMBDIkdBYPimV4pQ7W8EQM'
+        'UA4LMhMzCyW5watKgJoOHhxsuIz3wscVb8ExhpIxDoIgvcEzhoaiZ1geA20Rj+UAwlp4LDxd8'
+        'OkqO4KHYXLI4oYOwEai4oPRmHiZXr6iXOiY9mXBFUNYacAVDm4uIOCiaXws24plK9oq7PIUr5'
+        '6iOqsyg+acyOrezJicpTCI3YYy5HtapFNZSldLCcRgCCk4hqniDZ2dHZjCMf1EXh47laNEN2M'
+        'fEjkzJFgtK3BLHwEAGTcnlSu7LNPLUbo6+n2m5GbAuVzUr/ShYQzoSBSWi5iXJwyVqWRr4ctX'
+        '+om1mq+GR7ibAA8dJuHLfC5nGVbjl7dMS/tk1g3tB3OXZyWXsyyrsMtWtlXY5SnHGmwpPwW+s'
+        '3M15h5CkVvM8FyWcWH3Uce5io00A/8Eu7wUWoVdXoqswi4v5eIlseTWl6e9Cqh6+IUt6OoUwA'
+        'JD88KwjC4rJVZAazmpsAa6jFRaA10+qqyBLht1DRu1bNQ1bLSy0S425mWFOc9khtxcnRwuaEW'
+        '6PZnH8sFp5aPRKuwy0i5GMnsmHJE32dz73a5oG3nJgLyemqDgXKtPu/m2//ix379d7u6m8+Xd'
+        'bLrf5jg2Y9picD5OB/NpN4vQIrYYLWKJHiX6aJFblBahRSvRvEUsETuQjRapxe6uHSjPsBK7u'
+        '0CL0mKUyLKJ25/NLbRaUI+PzwGsRWrxzOr0qKNy5+ydHnVUzsftj7JFdK7cAUSrW3SugrdpRe'
+        'eqdluV6Fxdu6hdv6hcCeYabQl7KFG5ElWpiM6itqgtWovWorXYlU6/d234y/71+eWUVud1dRv'
+        'z2xT/en06vcwfWiP7QFU51dP7l/3H7u1xX2+gP9F+/MHc7jw1fz98vD99fTxV65yN6YfP81jE'
+        '8nDMa8j81bD5B2R9zCo='),
 
-circle = gdb.str_to_gesture('eNp1l31MG3UYxw/CgAlzlaBhRk2jmFSdhBiz1DnTy7LlFpdpFV8ImVl5OXoMaLu+0B6B0tcxtAkkHtlcwsQoG2YjwBxu6EwhsmzEOdnmpGRsFBcjuinMRCUzir3jnnt6vev908vn+/x+z+95+T2X+rK63esI4Ynk19c1sSVm2uF02WkukkOJb+9zT/m5Vk4XWeOuq3EyHEU2kqsrshm6zsw4E8QaXeGfyHpx+R6b3VrjquYlrWv4r18HliM5DqfdWk87uHc4hoisE3cvEyD6yLZZ6yxO3kiXsMoXrYw8RKMMD0dFx7SkPzNLE8lgOcow0x87MXx1t6uKeWDVhimkope2eO7eOt/LPEgZYj+/ebTvy41y/drxtwYqRjy8/v2RiVDlc4VyfXpxLur9j+D1KxUv2rf8ckCuX9/UMPNZ7RSvTz66o33MpJXrNwX/HK9/nql99qsXSLk+5/33n78XF3j9YLv35J1rhFyPJ+LL1RQn9Ojp8u6XiuyaFH08mJ1f9DyvT1L+PPqOLUX/aGv4vsKNvH7F+vap9YNDKf6j/AGWeX36XmOcqUzZ/0bzn7enB2t4fXYiI/vUva1yPZaIrvOxbbw+n7OzKHR5MiW/e/kMm3j9x7Wvark/8uT6Rb1t/ut2raDfLjj28f0p+48/vq2joNjI67fyynR9BTvl+ic6YyJCMp1u6C81jQfXjAn7v/tacU/mM3L93NNvfPp6n7B+nrr48IGZWbm+2j8+Xo9vv1DgGT0s168ee6VnszOeLj+GH367ftpy44yQX7Z+1mT8Xa7HhqvOvfeQjtcvN5YdX+lk5PqM/advDpaU8/r5ieaVXWc1afXR3T279Ce7UvYX6qPn9Y5A8c1Bhkh3PsMI8ciTAxuIdPEZJrhN1e7vctPlx/Dt0YoTuXfL5fpEIrsvd2uF+7PhC5t+3iPXR4T8m4T7N7d9P725WF7fLuGGC/tPP3HpUEfgrKuKjuQ7qu00bcE5QZH+LmEeUWRzXHjZz6VhNmBLyIwqTKtkvgXlfr4hYEPIJB8+/jdDYDpgWsmubXViUiT7ofAisFLRjtVIdt4pkXlwP69JeKVIN671EqJd05S0trVXZC48cyvE60xiGpE5MN6WJWB4lpa4yOykdJYWON8+E9oBs/Uq11rnpDNLfi0YWyspskbMVatPZPVJa8HH3jHMFdStLikvsJbBeL0QG6OV/LaZRGZuw3qADzOexQc1qkW/Pg8wE9Yc1tZirqS+qkW/fp8KiytZgFRhvUq/gUWxr2ox90G92C9mAhncD/MeKd4g+DVjnkPQuwz6CNmUOQ31Q+6xD0IxqBGBa1fE8yXVLQw+6jH3YUq0a0C/YQZ6A32EIX+WJLsuMV5rkh3kylaKdv3KPg0Pin73Yd+Hz0CPdymZXcXO7lNhS0rmsGK84NeBOZXO5zTimQ8Bw5kjxevSKPPiSvIB+XPhjAjDPGhKyoseWFIcWuV8kWrpRr8hmJNuIzK4C+5O7CuYnW7sgxD0pAf7VOo1D54vVA4sqSdJ5ZwMwZk9mKtQLjCMIwjzwIM1CkLvskl35gIwnAdBiIMtRQY1YjEHQZ9YIxbrEYR6sNj3QahH0ndBur/sIDKIjcX8BSE2FntImgcsxhaA2JoxtsAYMKxloF/53QpI31WMNyB980hkJhW2Axj2c0CvwrQqTKPCclUYoWT+ZRW2pMIWVFhchcVU2FQqo11VlZG1TmsDba+0VNOJfymjH/DP4UiWpbIx8Q+L4FxVJf8Do0JS0w==')
+    'square': (
+        'eNq1mEluIzcYRvd1EXsT4Z+HC6i3AXyAwG0LttEdW7DUSfr2YZHVEgk4KQGCtZH8RD4OH4eSb'
+        '1++vfz1c/O0Oxx/vO+mL8v7Hqbbxz1Odzev93/ubqY9lY/ljafD3c3h+P72bXcof8p0+32v0+'
+        '2HkrtabNrbrPJSf//28nqcq8VcLf+j2u9zqWmPrQdzF36WKkjTFjasKZKMaJwqGTp355/5a56'
+        '2v8FGREAVLIINymebDl/v/78Zqc3o9LS04EgogK6ECeSlhadFTomIHElsKqoS6/I6dPQL5JiW'
+        'aSTKYMZEuS6PKs8L5DD03DB11U51+gnX7EVuGOQUgqDIxHGBnKqc1+XkJXLMyAyXUFkPlGqgp'
+        'J/irnmSr7s5kThBIhAB5RJ3jZPOcYpbiIG6elkc81Je3DL222TVzTVMPoVJggFESoEGBIJndy'
+        'irWWpYRonyAnfNkk9ZQkQYghuLSlnI7tfIa5i8hDmvZFBSUwdH5ixDgKv6XvNkP+mxbDxgo1S'
+        '2JIhr3DVPzpOb0IGQ3DTVhTPP8nEH+bpcaqCCJzkHOjlqpISFAp/lZMqMZqIBLnCBvCYqfJKL'
+        'EqNyCgkFFNlZjt0qJaD1rS81UTknKuEGqYgRGUZdnsxlnapilrkiKafjurzmKec8Sy12KTPvT'
+        'mWn5lle9mS/B2z9MJcaqOSqvC7TflRlkZZ7bM2vNVPFT/PXWJUv8ZO5hkiAQVkz5Wpat9dcVT'
+        '/JXoNVv8Quoz3Wl43WZDU/x241V1vfq+UrRTFhLicyAxpecG1YTdXOqVLXP4XSRmcHCg/NIPG'
+        'AcnOs22uqdk4Vx777dfaaqp2uU+jPWGdkvcpeU7X8HLvXVP10pWJKOdSFksIMSgNXyWuofrpT'
+        'yyUKaewgxuCJeJW8ZuqnB6TxIATspkXGJ16r8vkHwMP7bvd6epx3m5/ny0V/uy1X4wamLaWVt'
+        '+PeY7qfoQ8wG8wGvcKACjMGiDMsj/EDpApRB8gV0lhdKpSxulaoI7QKDQfoDfIAY4Cyyf4lc4'
+        'lsJaSV4FotYYDzCd69bC6BfYloU5XUQ88GeYBLA9JD+6BfqX0J1VZtGThVKD72i+cS3k+NUKv'
+        'WZkFbhMwfVMu+BOXYHy8lENqcaMuM2vyWp+WB2kJpoLrQNhOqI21Toa3HJAttw5c2fOKFtvGz'
+        'jrSNmWikbdAAI11WMw8U23L2HCkOdBkxUk8/msyyCVsj0IeAKAP9aI5R+yJ1+mZqPXVYqPc0f'
+        'jUSA82FZk9zmWNqo45hG5WfSB1lWOaCqDMwLDkTD/SXoQy0nTzPu5en52P9f4BO25jbLfTvl8'
+        'fjc4VWoDZ4fPu+e79/fdjVL7we0jC+cC63nJJ/7N/fHn88NHdM29xw+VUXOp+Mzm7FcPi6+Re'
+        'GcFi7'),
+}
 
-check = gdb.str_to_gesture(
-    'eNq1l0tuI0cMhvd9EXsTofgmL6BsA/gAgcYWbGMmtmBpksztwyY1kgZI0rNpbdr+u+pjkX+9+'
-    'v718+uf3zbP++Pp68d++vX8PIzp/ukA08Pd2+6P/d10wPwzHzQdH+6Op4/3z/tj/svT/ZeDTP'
-    'f/CnmoZtNBZ5Rl/8P769tp7uZzt/iPbr/NraYD9AjmIXzLLoDTdmxgBLsSMMIw5OHzcP6eX9O'
-    '0/WVsCMFGmCuaGgjBdPy0+/8wXGFkeu4Ig7LzgISbMw/j6fh8hmMMBDIkdBYPimV4pQ7W8EQM'
-    'UA4LMhMzCyW5watKgJoOHhxsuIz3wscVb8ExhpIxDoIgvcEzhoaiZ1geA20Rj+UAwlp4LDxd8'
-    'OkqO4KHYXLI4oYOwEai4oPRmHiZXr6iXOiY9mXBFUNYacAVDm4uIOCiaXws24plK9oq7PIUr5'
-    '6iOqsyg+acyOrezJicpTCI3YYy5HtapFNZSldLCcRgCCk4hqniDZ2dHZjCMf1EXh47laNEN2M'
-    'fEjkzJFgtK3BLHwEAGTcnlSu7LNPLUbo6+n2m5GbAuVzUr/ShYQzoSBSWi5iXJwyVqWRr4ctX'
-    '+om1mq+GR7ibAA8dJuHLfC5nGVbjl7dMS/tk1g3tB3OXZyWXsyyrsMtWtlXY5SnHGmwpPwW+s'
-    '3M15h5CkVvM8FyWcWH3Uce5io00A/8Eu7wUWoVdXoqswi4v5eIlseTWl6e9Cqh6+IUt6OoUwA'
-    'JD88KwjC4rJVZAazmpsAa6jFRaA10+qqyBLht1DRu1bNQ1bLSy0S425mWFOc9khtxcnRwuaEW'
-    '6PZnH8sFp5aPRKuwy0i5GMnsmHJE32dz73a5oG3nJgLyemqDgXKtPu/m2//ix379d7u6m8+Xd'
-    'bLrf5jg2Y9picD5OB/NpN4vQIrYYLWKJHiX6aJFblBahRSvRvEUsETuQjRapxe6uHSjPsBK7u'
-    '0CL0mKUyLKJ25/NLbRaUI+PzwGsRWrxzOr0qKNy5+ydHnVUzsftj7JFdK7cAUSrW3SugrdpRe'
-    'eqdluV6Fxdu6hdv6hcCeYabQl7KFG5ElWpiM6itqgtWovWorXYlU6/d234y/71+eWUVud1dRv'
-    'z2xT/en06vcwfWiP7QFU51dP7l/3H7u1xX2+gP9F+/MHc7jw1fz98vD99fTxV65yN6YfP81jE'
-    '8nDMa8j81bD5B2R9zCo=')
 
-square = gdb.str_to_gesture(
-    'eNq1mEluIzcYRvd1EXsT4Z+HC6i3AXyAwG0LttEdW7DUSfr2YZHVEgk4KQGCtZH8RD4OH4eSb'
-    '1++vfz1c/O0Oxx/vO+mL8v7Hqbbxz1Odzev93/ubqY9lY/ljafD3c3h+P72bXcof8p0+32v0+'
-    '2HkrtabNrbrPJSf//28nqcq8VcLf+j2u9zqWmPrQdzF36WKkjTFjasKZKMaJwqGTp355/5a56'
-    '2v8FGREAVLIINymebDl/v/78Zqc3o9LS04EgogK6ECeSlhadFTomIHElsKqoS6/I6dPQL5JiW'
-    'aSTKYMZEuS6PKs8L5DD03DB11U51+gnX7EVuGOQUgqDIxHGBnKqc1+XkJXLMyAyXUFkPlGqgp'
-    'J/irnmSr7s5kThBIhAB5RJ3jZPOcYpbiIG6elkc81Je3DL222TVzTVMPoVJggFESoEGBIJndy'
-    'irWWpYRonyAnfNkk9ZQkQYghuLSlnI7tfIa5i8hDmvZFBSUwdH5ixDgKv6XvNkP+mxbDxgo1S'
-    '2JIhr3DVPzpOb0IGQ3DTVhTPP8nEH+bpcaqCCJzkHOjlqpISFAp/lZMqMZqIBLnCBvCYqfJKL'
-    'EqNyCgkFFNlZjt0qJaD1rS81UTknKuEGqYgRGUZdnsxlnapilrkiKafjurzmKec8Sy12KTPvT'
-    'mWn5lle9mS/B2z9MJcaqOSqvC7TflRlkZZ7bM2vNVPFT/PXWJUv8ZO5hkiAQVkz5Wpat9dcVT'
-    '/JXoNVv8Quoz3Wl43WZDU/x241V1vfq+UrRTFhLicyAxpecG1YTdXOqVLXP4XSRmcHCg/NIPG'
-    'AcnOs22uqdk4Vx777dfaaqp2uU+jPWGdkvcpeU7X8HLvXVP10pWJKOdSFksIMSgNXyWuofrpT'
-    'yyUKaewgxuCJeJW8ZuqnB6TxIATspkXGJ16r8vkHwMP7bvd6epx3m5/ny0V/uy1X4wamLaWVt'
-    '+PeY7qfoQ8wG8wGvcKACjMGiDMsj/EDpApRB8gV0lhdKpSxulaoI7QKDQfoDfIAY4Cyyf4lc4'
-    'lsJaSV4FotYYDzCd69bC6BfYloU5XUQ88GeYBLA9JD+6BfqX0J1VZtGThVKD72i+cS3k+NUKv'
-    'WZkFbhMwfVMu+BOXYHy8lENqcaMuM2vyWp+WB2kJpoLrQNhOqI21Toa3HJAttw5c2fOKFtvGz'
-    'jrSNmWikbdAAI11WMw8U23L2HCkOdBkxUk8/msyyCVsj0IeAKAP9aI5R+yJ1+mZqPXVYqPc0f'
-    'jUSA82FZk9zmWNqo45hG5WfSB1lWOaCqDMwLDkTD/SXoQy0nTzPu5en52P9f4BO25jbLfTvl8'
-    'fjc4VWoDZ4fPu+e79/fdjVL7we0jC+cC63nJJ/7N/fHn88NHdM29xw+VUXOp+Mzm7FcPi6+Re'
-    'GcFi7')
+def __getattr__(name):
+    if name not in gesture_strings:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from kivy.gesture import GestureDatabase
+    gesture = GestureDatabase().str_to_gesture(gesture_strings[name])
+    globals()[name] = gesture
+    return gesture
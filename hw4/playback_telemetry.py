@@ -0,0 +1,96 @@
+import os
+import time
+from array import array
+
+nan = float('nan')
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values: return 0.0
+    idx = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+# Per-word playback timestamps, kept in a fixed size ring buffer so recording never allocates or does I/O.
+#
+# For every word shown the buffer keeps the time the timeline scheduled it for, the time the reader displayed it
+# (set the label text) and the time its texture was ready on the next frame, all on the perf_counter clock. Only
+# the last capacity words are kept. flush() appends them to a CSV file followed by a summary of how late the words
+# were; summary() returns the same numbers without writing anything.
+#
+# With enabled False every call returns right away, so the hooks can stay in the playback path.
+class PlaybackTelemetry:
+    def __init__(self, capacity=4096, enabled=False):
+        self.capacity = capacity
+        self.enabled = enabled
+        self.clock = time.perf_counter
+
+        self.word_idx = array('q', bytes(8 * capacity))
+        self.scheduled = array('d', [nan]) * capacity
+        self.displayed = array('d', [nan]) * capacity
+        self.texture_ready = array('d', [nan]) * capacity
+        self.count = 0  # words recorded since the last flush, including any the buffer has wrapped over
+        self._pending = -1  # slot still waiting for its texture
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    # Record that word idx, scheduled for the given clock time, was just displayed
+    def word_shown(self, idx, scheduled):
+        if not self.enabled: return
+        slot = self.count % self.capacity
+        self.word_idx[slot] = idx
+        self.scheduled[slot] = scheduled
+        self.displayed[slot] = self.clock()
+        self.texture_ready[slot] = nan
+        self.count += 1
+        self._pending = slot
+
+    # Record that the texture of the last word shown is ready; takes the Clock's dt so it can be a Clock callback
+    def mark_texture_ready(self, *args):
+        if self._pending < 0: return
+        self.texture_ready[self._pending] = self.clock()
+        self._pending = -1
+
+    # (word index, scheduled, displayed, texture ready) for the buffered words, oldest first
+    def records(self):
+        first = self.count - len(self)
+        for i in range(first, self.count):
+            slot = i % self.capacity
+            yield self.word_idx[slot], self.scheduled[slot], self.displayed[slot], self.texture_ready[slot]
+
+    # Lateness percentiles in milliseconds: display is how long after its scheduled time a word was displayed,
+    # texture how long after its scheduled time its texture was ready (the frame it actually appeared in)
+    def summary(self):
+        display_late = []
+        texture_late = []
+        for idx, scheduled, displayed, texture_ready in self.records():
+            display_late.append((displayed - scheduled) * 1e3)
+            if texture_ready == texture_ready:  # not nan
+                texture_late.append((texture_ready - scheduled) * 1e3)
+        display_late.sort()
+        texture_late.sort()
+
+        summary = {'words': len(display_late), 'dropped': self.count - len(self)}
+        for name, values in (('display', display_late), ('texture', texture_late)):
+            for label, fraction in (('p50', 0.50), ('p90', 0.90), ('p99', 0.99), ('max', 1.0)):
+                summary[f'{name}_{label}_ms'] = percentile(values, fraction)
+        return summary
+
+    # Append the buffered words and their summary to path, then empty the buffer. Returns the summary.
+    def flush(self, path):
+        summary = self.summary()
+        if summary['words'] == 0: return summary
+
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        with open(path, 'a') as f:
+            if new_file:
+                f.write('word,scheduled,displayed,texture_ready\n')
+            for idx, scheduled, displayed, texture_ready in self.records():
+                f.write(f'{idx},{scheduled:.6f},{displayed:.6f},{texture_ready:.6f}\n')
+            f.write('# ' + ' '.join(f'{key}={value:.2f}' if isinstance(value, float) else f'{key}={value}'
+                                    for key, value in summary.items()) + '\n')
+
+        self.count = 0
+        self._pending = -1
+        return summary
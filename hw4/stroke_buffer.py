@@ -0,0 +1,68 @@
+import numpy as np
+from kivy.graphics import Color, Ellipse, InstructionGroup, Line
+
+
+# The points of a stroke being drawn, in a NumPy array that doubles in size whenever it fills up.
+#
+# Points closer than min_distance to the last kept point are dropped, since they add nothing to the shape and a
+# slow finger produces lots of them. points is a view of the kept points that the recognizer takes as it is.
+class StrokeBuffer:
+    def __init__(self, min_distance=2.0, capacity=256):
+        self.min_distance = min_distance
+        self._data = np.empty((capacity, 2))
+        self.count = 0
+        self._last_x = self._last_y = 0.0
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def points(self):
+        return self._data[:self.count]
+
+    # Add a point; returns False if it was too close to the last one and dropped
+    def add(self, x, y):
+        if self.count:
+            dx = x - self._last_x
+            dy = y - self._last_y
+            if dx * dx + dy * dy < self.min_distance * self.min_distance:
+                return False
+        if self.count == len(self._data):
+            grown = np.empty((2 * len(self._data), 2))
+            grown[:self.count] = self._data
+            self._data = grown
+
+        self._data[self.count] = x, y
+        self.count += 1
+        self._last_x, self._last_y = x, y
+        return True
+
+
+# The on-screen trail of a stroke: a dot where it started and the path drawn so far.
+#
+# The path is split into Lines of at most chunk points. Adding a point only resets the points of the last Line, so
+# the cost of an update stays the same however long the stroke gets. Each new Line starts at the last point of the
+# one before, so the path has no gaps.
+class StrokeTrail:
+    def __init__(self, x, y, color=(1, 0, 0, 1), dot_size=30.0, chunk=64):
+        self.chunk = chunk
+        self.group = InstructionGroup()
+        self.color = Color(*color)
+        self.group.add(self.color)
+        self._new_line(x, y)
+        self.group.add(Ellipse(pos=(x - dot_size / 2, y - dot_size / 2), size=(dot_size, dot_size)))
+
+    def add(self, x, y):
+        if len(self._points) >= 2 * self.chunk:
+            self._new_line(*self._points[-2:])
+        self._points += (x, y)
+        self._line.points = self._points
+
+    # Tint the trail from red (no idea yet) to green (sure) as the recognizer's confidence changes
+    def set_confidence(self, confidence):
+        self.color.rgba = (1 - confidence, confidence, 0, 1)
+
+    def _new_line(self, x, y):
+        self._points = [x, y]
+        self._line = Line(points=self._points)
+        self.group.add(self._line)